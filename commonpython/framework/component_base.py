@@ -328,3 +328,5 @@ class ComponentBase(ABC):
                 self.cleanup()
             except Exception as e:
                 self.log_error(f"Component cleanup error: {str(e)}")
+            # Push out records still queued or buffered by the logger
+            self.logger_manager.flush()
@@ -4,19 +4,94 @@ Logger Manager for CommonPython Framework
 Provides centralized logging functionality using only standard Python modules with support for:
 - Multiple log levels
 - File and console handlers
-- Structured logging with JSON format
+- Structured logging with JSON format (accelerated by orjson when installed)
 - Log rotation
 - Custom formatters
+- Optional asynchronous handler dispatch via a background queue listener
 """
 
+import atexit
+import copy
+import enum
 import json
 import logging
 import logging.handlers
+import math
+import queue
 import sys
+from collections.abc import Iterable
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+# Try to import orjson for faster JSON serialization
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+DEFAULT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+# Console output goes to stdout; ANSI colors are only useful on a terminal
+_IS_TTY = bool(getattr(sys.stdout, "isatty", None) and sys.stdout.isatty())
+
+# Running queue listeners by logger name, so a manager re-created under the same
+# name can stop the thread left behind by its predecessor
+_LISTENERS: dict[str, logging.handlers.QueueListener] = {}
+
+
+def _close_handlers(handlers: Iterable[logging.Handler]) -> None:
+    """
+    Flush and close handlers.
+
+    @brief Close each handler, including the file handler behind a MemoryHandler.
+    @param handlers Handlers to close
+    """
+    for handler in handlers:
+        # MemoryHandler flushes on close but leaves its target open
+        target = getattr(handler, "target", None)
+        handler.close()
+        if target:
+            target.close()
+
+
+def _stop_listeners() -> None:
+    """
+    Stop every running queue listener.
+
+    @brief Drain queued records at interpreter exit; listener threads are daemons.
+    """
+    while _LISTENERS:
+        _, listener = _LISTENERS.popitem()
+        listener.stop()
+        _close_handlers(listener.handlers)
+
+
+# Registered after logging's own shutdown hook, so it runs first
+atexit.register(_stop_listeners)
+
+
+def _orjson_matches_json(value: Any) -> bool:
+    """
+    Check whether orjson renders a value the way json.dumps(default=str) does.
+
+    @brief Reject the values orjson serializes differently: non-finite floats, plain enums
+           and tuple subclasses such as named tuples.
+    @param value Value to check, walked recursively through dicts, lists and tuples
+    @return True if both serializers produce the same JSON for the value
+    """
+    if isinstance(value, float):
+        return math.isfinite(value)
+    if isinstance(value, enum.Enum):
+        return isinstance(value, (int, str))
+    if isinstance(value, dict):
+        return all(_orjson_matches_json(item) for item in value.values())
+    if isinstance(value, list) or type(value) is tuple:
+        return all(_orjson_matches_json(item) for item in value)
+    return not isinstance(value, tuple)
+
 
 class JSONFormatter(logging.Formatter):
     """
@@ -25,6 +100,33 @@ class JSONFormatter(logging.Formatter):
     @brief Provides JSON formatting for log records using standard Python modules.
     """
 
+    # LogRecord attributes that are not copied into the JSON output as extra fields
+    _RESERVED_ATTRS = frozenset(
+        (
+            "name",
+            "msg",
+            "args",
+            "levelname",
+            "levelno",
+            "pathname",
+            "filename",
+            "module",
+            "exc_info",
+            "exc_text",
+            "stack_info",
+            "lineno",
+            "funcName",
+            "created",
+            "msecs",
+            "relativeCreated",
+            "thread",
+            "threadName",
+            "processName",
+            "process",
+            "getMessage",
+        )
+    )
+
     def format(self, record: logging.LogRecord) -> str:
         """
         Format log record as JSON.
@@ -48,35 +150,50 @@ class JSONFormatter(logging.Formatter):
             log_entry["exception"] = self.formatException(record.exc_info)
 
         # Add extra fields
+        reserved = self._RESERVED_ATTRS
         for key, value in record.__dict__.items():
-            if key not in [
-                "name",
-                "msg",
-                "args",
-                "levelname",
-                "levelno",
-                "pathname",
-                "filename",
-                "module",
-                "exc_info",
-                "exc_text",
-                "stack_info",
-                "lineno",
-                "funcName",
-                "created",
-                "msecs",
-                "relativeCreated",
-                "thread",
-                "threadName",
-                "processName",
-                "process",
-                "getMessage",
-            ]:
+            if key not in reserved:
                 log_entry[key] = value
 
+        if HAS_ORJSON and _orjson_matches_json(log_entry):
+            try:
+                serialized = orjson.dumps(
+                    log_entry,
+                    default=str,
+                    option=orjson.OPT_NON_STR_KEYS
+                    | orjson.OPT_PASSTHROUGH_DATETIME
+                    | orjson.OPT_PASSTHROUGH_DATACLASS,
+                )
+                return str(serialized, "utf-8")
+            except TypeError:
+                # orjson rejects some values json accepts (e.g. ints beyond 64 bits)
+                pass
+
         return json.dumps(log_entry, default=str)
 
 
+class _RecordQueueHandler(logging.handlers.QueueHandler):
+    """
+    Queue handler that keeps exception info on enqueued records.
+
+    @brief Merge message arguments eagerly while leaving exc_info for downstream formatters.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Prepare a record for enqueuing.
+
+        @brief Resolve the message now so later mutation of args cannot change it.
+        @param record LogRecord instance to enqueue
+        @return Copy of the record with the message merged
+        """
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        return record
+
+
 class LoggerManager:
     """
     Centralized logging manager for the CommonPython framework.
@@ -96,6 +213,9 @@ class LoggerManager:
         self.name = name
         self.config = config or {}
         self.logger = logging.getLogger(name)
+        self._listener: logging.handlers.QueueListener | None = None
+        # Handlers this manager installed on the (possibly shared) named logger
+        self._handlers: list[logging.Handler] = []
         self._setup_logger()
 
     def _setup_logger(self) -> None:
@@ -104,7 +224,14 @@ class LoggerManager:
 
         @brief Configure logger with console and file handlers.
         """
-        # Clear existing handlers
+        # Stop a listener started by an earlier manager for this logger
+        listener = _LISTENERS.pop(self.name, None)
+        if listener:
+            listener.stop()
+            _close_handlers(listener.handlers)
+
+        # Close handlers left by an earlier manager so their buffered records are written
+        _close_handlers(self.logger.handlers[:])
         self.logger.handlers.clear()
 
         # Set log level
@@ -117,6 +244,10 @@ class LoggerManager:
         # Setup handlers
         self._setup_console_handler()
         self._setup_file_handler()
+        self._setup_stream_handler()
+
+        if self.config.get("async", False):
+            self._setup_queue_listener()
 
     def _setup_console_handler(self) -> None:
         """
@@ -130,21 +261,17 @@ class LoggerManager:
         console_handler.setLevel(getattr(logging, self.config.get("level", "INFO").upper()))
         # Use colored formatter for console
         if self.config.get("colored", True):
-            console_formatter = ColoredFormatter(
-                self.config.get("format", "%(asctime)s - %(name)s - %(levelname)s - %(message)s")
-            )
+            console_formatter = ColoredFormatter(self.config.get("format", DEFAULT_FORMAT))
         else:
-            console_formatter = logging.Formatter(
-                self.config.get("format", "%(asctime)s - %(name)s - %(levelname)s - %(message)s")
-            )
+            console_formatter = logging.Formatter(self.config.get("format", DEFAULT_FORMAT))
         console_handler.setFormatter(console_formatter)
-        self.logger.addHandler(console_handler)
+        self._add_handler(console_handler)
 
     def _setup_file_handler(self) -> None:
         """
         Setup file handler with rotation.
 
-        @brief Configure file handler with log rotation using standard Python modules.
+        @brief Configure optionally buffered file handler with log rotation using standard modules.
         """
         log_file = self.config.get("file")
         log_dir = self.config.get("dir")
@@ -162,14 +289,126 @@ class LoggerManager:
             str(log_path), maxBytes=max_bytes, backupCount=backup_count
         )
         file_handler.setLevel(logging.DEBUG)
-        if self.config.get("json_format", True):
-            file_formatter = JSONFormatter()
-        else:
-            file_formatter = logging.Formatter(
-                self.config.get("format", "%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+        file_handler.setFormatter(self._record_formatter())
+
+        # Optionally batch file writes; records at ERROR and above flush the buffer immediately
+        buffer_size = self.config.get("buffer_size", 0)
+        if buffer_size > 0:
+            self._add_handler(
+                logging.handlers.MemoryHandler(
+                    capacity=buffer_size,
+                    flushLevel=logging.ERROR,
+                    target=file_handler,
+                    flushOnClose=True,
+                )
             )
-        file_handler.setFormatter(file_formatter)
-        self.logger.addHandler(file_handler)
+        else:
+            self._add_handler(file_handler)
+
+    def _setup_stream_handler(self) -> None:
+        """
+        Setup handler writing structured records to a caller-supplied stream.
+
+        @brief Attach a stream handler formatted like the file handler when a stream is configured.
+        """
+        stream = self.config.get("stream")
+        if stream is None:
+            return
+        stream_handler = logging.StreamHandler(stream)
+        stream_handler.setLevel(logging.DEBUG)
+        stream_handler.setFormatter(self._record_formatter())
+        self._add_handler(stream_handler)
+
+    def _add_handler(self, handler: logging.Handler) -> None:
+        """
+        Attach a handler owned by this manager.
+
+        @brief Add the handler to the logger and remember it for flush() and close().
+        @param handler Handler to attach
+        """
+        self._handlers.append(handler)
+        self.logger.addHandler(handler)
+
+    def _record_formatter(self) -> logging.Formatter:
+        """
+        Build the formatter used for file and stream output.
+
+        @brief Select JSON or plain text formatting based on configuration.
+        @return Formatter instance
+        """
+        if self.config.get("json_format", True):
+            return JSONFormatter()
+        return logging.Formatter(self.config.get("format", DEFAULT_FORMAT))
+
+    def _setup_queue_listener(self) -> None:
+        """
+        Move configured handlers behind a queue serviced by a background thread.
+
+        @brief Callers only enqueue records; the listener thread performs handler I/O.
+        """
+        handlers = self._handlers
+        if not handlers:
+            return
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        for handler in handlers:
+            self.logger.removeHandler(handler)
+        self._handlers = []
+        self._add_handler(_RecordQueueHandler(log_queue))
+        self._listener = logging.handlers.QueueListener(
+            log_queue, *handlers, respect_handler_level=True
+        )
+        self._listener.start()
+        _LISTENERS[self.name] = self._listener
+
+    def _owns_listener(self) -> bool:
+        """
+        Check whether this manager's queue listener is still running.
+
+        @brief A later manager for the same logger stops and replaces the listener.
+        @return True if the listener was started by this manager and not yet stopped
+        """
+        return self._listener is not None and _LISTENERS.get(self.name) is self._listener
+
+    def _all_handlers(self) -> list[logging.Handler]:
+        """
+        Get every handler owned by this manager.
+
+        @brief Collect the handlers this manager attached plus those behind its queue listener.
+        @return List of handlers
+        """
+        handlers = list(self._handlers)
+        if self._listener:
+            handlers.extend(self._listener.handlers)
+        return handlers
+
+    def flush(self) -> None:
+        """
+        Flush all handlers.
+
+        @brief Drain the queue listener, then write buffered log records to their destinations.
+        """
+        if self._listener and self._owns_listener():
+            # stop() returns once the thread has handled every queued record
+            self._listener.stop()
+            self._listener.start()
+        for handler in self._all_handlers():
+            handler.flush()
+
+    def close(self) -> None:
+        """
+        Flush and close all handlers.
+
+        @brief Stop the queue listener (draining pending records) and close handlers.
+        """
+        handlers = self._all_handlers()
+        if self._listener and self._owns_listener():
+            self._listener.stop()
+            del _LISTENERS[self.name]
+        self._listener = None
+        _close_handlers(handlers)
+        for handler in handlers:
+            self.logger.removeHandler(handler)
+        self._handlers = []
 
     def get_logger(self, name: str | None = None) -> logging.Logger:
         """
@@ -278,7 +517,7 @@ class LoggerManager:
         @param level Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         """
         self.logger.setLevel(getattr(logging, level.upper(), logging.INFO))
-        for handler in self.logger.handlers:
+        for handler in self._all_handlers():
             handler.setLevel(getattr(logging, level.upper(), logging.INFO))
 
 
@@ -298,6 +537,27 @@ class ColoredFormatter(logging.Formatter):
         "RESET": "\033[0m",  # Reset
     }
 
+    _RESET = COLORS["RESET"]
+    _COLOR_BY_LEVELNO = {
+        logging.DEBUG: COLORS["DEBUG"],
+        logging.INFO: COLORS["INFO"],
+        logging.WARNING: COLORS["WARNING"],
+        logging.ERROR: COLORS["ERROR"],
+        logging.CRITICAL: COLORS["CRITICAL"],
+    }
+
+    def __init__(self, *args: Any, force_color: bool = False, **kwargs: Any):
+        """
+        Initialize the colored formatter.
+
+        @brief Initialize the formatter and decide whether to emit colors.
+        @param args Positional arguments for logging.Formatter
+        @param force_color Emit colors even when stdout is not a terminal
+        @param kwargs Keyword arguments for logging.Formatter
+        """
+        super().__init__(*args, **kwargs)
+        self._color = force_color or _IS_TTY
+
     def format(self, record: logging.LogRecord) -> str:
         """
         Format log record with colors.
@@ -308,12 +568,13 @@ class ColoredFormatter(logging.Formatter):
         """
         # Get the original formatted message
         message = super().format(record)
-
-        # Add color based on log level
-        level_name = record.levelname
-        if level_name in self.COLORS:
-            color = self.COLORS[level_name]
-            reset = self.COLORS["RESET"]
-            message = message.replace(level_name, f"{color}{level_name}{reset}")
+        if not self._color:
+            return message
+
+        # Add color based on log level; unknown levels are left uncolored
+        color = self._COLOR_BY_LEVELNO.get(record.levelno, "")
+        if color:
+            level_name = record.levelname
+            message = message.replace(level_name, f"{color}{level_name}{self._RESET}")
 
         return message
@@ -7,6 +7,7 @@ Supports testing of both CLI and library-based adapter implementations.
 """
 
 import os
+import random
 import sys
 import time
 import unittest
@@ -169,13 +170,55 @@ class DetailedTestRunner(unittest.TextTestRunner):
     resultclass = DetailedTestResult
 
 
-def run_comprehensive_tests(suite_filter: str | None = None, verbosity: int = 2):
+def shuffle_suite(suite: unittest.TestSuite, rng: random.Random) -> unittest.TestSuite:
+    """
+    Shuffle a test suite level by level.
+
+    @brief Randomize module, class and method order while keeping each class's tests together.
+    @param suite Suite returned by test discovery
+    @param rng Seeded random generator so a failing order can be replayed
+    @return New suite with the same tests, reordered
+    """
+    tests = [
+        shuffle_suite(test, rng) if isinstance(test, unittest.TestSuite) else test for test in suite
+    ]
+    rng.shuffle(tests)
+    return unittest.TestSuite(tests)
+
+
+def parse_int_option(arg: str) -> int:
+    """
+    Parse the value of a --name=N command line option.
+
+    @brief Exit with a usage error instead of a traceback when the value is not a number.
+    @param arg Command line argument in --name=N form
+    @return Non-negative integer value
+    """
+    name, _, value = arg.partition("=")
+    if not value.isdigit():
+        print(
+            ColoredOutput.colorize(
+                f"Error: {name} expects a non-negative integer, got '{value}'", ColoredOutput.FAIL
+            )
+        )
+        sys.exit(2)
+    return int(value)
+
+
+def run_comprehensive_tests(
+    suite_filter: str | None = None,
+    verbosity: int = 2,
+    durations: int = 5,
+    seed: int | None = None,
+):
     """
     Run comprehensive test suite with detailed reporting.
 
     @brief Execute all test cases with comprehensive reporting.
     @param suite_filter Optional filter for specific test suites
     @param verbosity Verbosity level for test output
+    @param durations Number of slowest tests to report
+    @param seed Shuffle the test order with this seed; None keeps discovery order
     @return Test result object
     """
     print_section("CommonPython Framework - Comprehensive Test Suite")
@@ -183,6 +226,8 @@ def run_comprehensive_tests(suite_filter: str | None = None, verbosity: int = 2)
     print(f"Python Version: {sys.version}")
     print(f"Working Directory: {os.getcwd()}")
     print(f"Test Filter: {suite_filter or 'All Tests'}")
+    if seed is not None:
+        print(f"Shuffle Seed: {seed}")
 
     # Check adapter availability
     print()
@@ -222,6 +267,9 @@ def run_comprehensive_tests(suite_filter: str | None = None, verbosity: int = 2)
         # Run all tests
         suite = loader.discover(test_dir, pattern="test_*.py")
 
+    if seed is not None:
+        suite = shuffle_suite(suite, random.Random(seed))
+
     # Create detailed test runner
     runner = DetailedTestRunner(
         verbosity=verbosity, stream=sys.stdout, descriptions=True, failfast=False
@@ -283,7 +331,9 @@ def run_comprehensive_tests(suite_filter: str | None = None, verbosity: int = 2)
         print_subsection("Performance Metrics")
 
         avg_time = sum(result.test_times.values()) / len(result.test_times)
-        slowest_tests = sorted(result.test_times.items(), key=lambda x: x[1], reverse=True)[:5]
+        slowest_tests = sorted(result.test_times.items(), key=lambda x: x[1], reverse=True)[
+            :durations
+        ]
 
         print(f"Average Test Time: {avg_time:.3f}s")
         print("\nSlowest Tests:")
@@ -315,13 +365,20 @@ def run_comprehensive_tests(suite_filter: str | None = None, verbosity: int = 2)
     return result
 
 
-def run_tests_with_coverage(suite_filter: str | None = None, verbosity: int = 2):
+def run_tests_with_coverage(
+    suite_filter: str | None = None,
+    verbosity: int = 2,
+    durations: int = 5,
+    seed: int | None = None,
+):
     """
     Run tests with coverage analysis.
 
     @brief Execute tests with coverage reporting if available.
     @param suite_filter Optional filter for specific test suites
     @param verbosity Verbosity level for test output
+    @param durations Number of slowest tests to report
+    @param seed Shuffle the test order with this seed; None keeps discovery order
     @return Test result object
     """
     try:
@@ -339,7 +396,7 @@ def run_tests_with_coverage(suite_filter: str | None = None, verbosity: int = 2)
         cov.start()
 
         # Run tests
-        result = run_comprehensive_tests(suite_filter, verbosity)
+        result = run_comprehensive_tests(suite_filter, verbosity, durations, seed)
 
         # Stop coverage
         cov.stop()
@@ -401,7 +458,7 @@ def run_tests_with_coverage(suite_filter: str | None = None, verbosity: int = 2)
             )
         )
         print("Install with: pip install coverage")
-        return run_comprehensive_tests(suite_filter, verbosity)
+        return run_comprehensive_tests(suite_filter, verbosity, durations, seed)
 
 
 def main():
@@ -418,6 +475,17 @@ def main():
     quiet = "--quiet" in args or "-q" in args
     list_tests = "--list" in args
 
+    # --durations=N reports the N slowest tests; --shuffle[=SEED] randomizes the test order
+    durations = 5
+    seed = None
+    for arg in args:
+        if arg.startswith("--durations="):
+            durations = parse_int_option(arg)
+        elif arg == "--shuffle":
+            seed = random.randrange(2**32)
+        elif arg.startswith("--shuffle="):
+            seed = parse_int_option(arg)
+
     # Extract suite filter if provided
     suite_filter = None
     for arg in args:
@@ -457,9 +525,9 @@ def main():
     # Run tests
     try:
         if run_coverage:
-            result = run_tests_with_coverage(suite_filter, verbosity)
+            result = run_tests_with_coverage(suite_filter, verbosity, durations, seed)
         else:
-            result = run_comprehensive_tests(suite_filter, verbosity)
+            result = run_comprehensive_tests(suite_filter, verbosity, durations, seed)
 
         # Print final status
         print()
@@ -227,11 +227,13 @@ class TestComponentBase(unittest.TestCase):
         @brief Test that component start method works correctly.
         """
         component = TestComponent(self.temp_config.name)
-        result = component.start()
+        with patch.object(component.logger_manager, "flush") as mock_flush:
+            result = component.start()
         self.assertTrue(result)
         self.assertTrue(component.initialized)
         self.assertTrue(component.ran)
         self.assertTrue(component.cleaned_up)
+        mock_flush.assert_called_once()
 
     def test_start_initialize_false(self):
         """
@@ -318,11 +318,6 @@ class TestManagerFactoryLibraryAdapters(unittest.TestCase):
             with patch(
                 "commonpython.adapters.db2_library_adapter.DB2LibraryAdapter", mock_adapter_class
             ):
-                # Also need to ensure the import in the factory works
-                import commonpython.adapters.db2_library_adapter as db2_lib_mod
-
-                db2_lib_mod.DB2LibraryAdapter = mock_adapter_class
-
                 manager = ManagerFactory.create_database_manager(config, self.logger)
 
                 self.assertIsNotNone(manager)
@@ -343,10 +338,6 @@ class TestManagerFactoryLibraryAdapters(unittest.TestCase):
             with patch(
                 "commonpython.adapters.db2_library_adapter.DB2LibraryAdapter", mock_adapter_class
             ):
-                import commonpython.adapters.db2_library_adapter as db2_lib_mod
-
-                db2_lib_mod.DB2LibraryAdapter = mock_adapter_class
-
                 manager = ManagerFactory.create_database_manager(config, None)
 
                 self.assertIsNotNone(manager)
@@ -371,10 +362,6 @@ class TestManagerFactoryLibraryAdapters(unittest.TestCase):
             with patch(
                 "commonpython.adapters.mq_library_adapter.MQLibraryAdapter", mock_adapter_class
             ):
-                import commonpython.adapters.mq_library_adapter as mq_lib_mod
-
-                mq_lib_mod.MQLibraryAdapter = mock_adapter_class
-
                 manager = ManagerFactory.create_messaging_manager(config, self.logger)
 
                 self.assertIsNotNone(manager)
@@ -400,10 +387,6 @@ class TestManagerFactoryLibraryAdapters(unittest.TestCase):
             with patch(
                 "commonpython.adapters.mq_library_adapter.MQLibraryAdapter", mock_adapter_class
             ):
-                import commonpython.adapters.mq_library_adapter as mq_lib_mod
-
-                mq_lib_mod.MQLibraryAdapter = mock_adapter_class
-
                 manager = ManagerFactory.create_messaging_manager(config, None)
 
                 self.assertIsNotNone(manager)
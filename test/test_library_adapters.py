@@ -8,11 +8,49 @@ library dependencies to ensure comprehensive code coverage.
 import sys
 import unittest
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import MagicMock, Mock, PropertyMock, patch
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+import commonpython.adapters as _adapters_pkg  # noqa: E402
+from commonpython.adapters import mq_library_adapter as _mq_mod  # noqa: E402
+from commonpython.adapters.mq_library_adapter import MQLibraryAdapter  # noqa: E402
+
+_saved_has_pymqi = None
+
+
+def setUpModule():
+    """Force pymqi availability for the MQ library adapter tests"""
+    global _saved_has_pymqi
+    _saved_has_pymqi = _mq_mod.HAS_PYMQI
+    _mq_mod.HAS_PYMQI = True
+
+
+def tearDownModule():
+    """Restore the original pymqi availability flag"""
+    _mq_mod.HAS_PYMQI = _saved_has_pymqi
+
+
+_MD_DEFAULTS = {
+    "MsgId": b"\x01\x02\x03\x04",
+    "CorrelId": b"",
+    "ReplyToQ": b"",
+    "ReplyToQMgr": b"",
+    "MsgType": 8,
+    "Format": b"MQSTR   ",
+    "Priority": 0,
+    "Persistence": 1,
+    "Expiry": -1,
+    "PutTime": b"12345678",
+    "PutDate": b"20240101",
+}
+
+
+class _MQMIError(Exception):
+    """Stand-in for pymqi.MQMIError carrying comp/reason codes"""
+
 
 class TestDB2LibraryAdapter(unittest.TestCase):
     """Comprehensive test suite for DB2LibraryAdapter"""
@@ -42,12 +80,18 @@ class TestDB2LibraryAdapter(unittest.TestCase):
         )
         self.ibm_db_patcher.start()
 
+        # Force a fresh import that binds the mocks; the patched sys.modules is
+        # restored on stop, and tearDown puts the package attribute back as well
+        self.saved_module = getattr(_adapters_pkg, "db2_library_adapter", None)
+        sys.modules.pop("commonpython.adapters.db2_library_adapter", None)
+
     def tearDown(self):
         """Clean up patches"""
         self.ibm_db_patcher.stop()
-        # Clear the module from cache if it was imported
-        if "commonpython.adapters.db2_library_adapter" in sys.modules:
-            del sys.modules["commonpython.adapters.db2_library_adapter"]
+        if self.saved_module is not None:
+            _adapters_pkg.db2_library_adapter = self.saved_module
+        elif hasattr(_adapters_pkg, "db2_library_adapter"):
+            del _adapters_pkg.db2_library_adapter
 
     def test_initialization_with_library(self):
         """Test adapter initialization when ibm_db is available"""
@@ -581,9 +625,10 @@ class TestDB2LibraryAdapter(unittest.TestCase):
 class TestMQLibraryAdapter(unittest.TestCase):
     """Comprehensive test suite for MQLibraryAdapter"""
 
-    def setUp(self):
-        """Set up test fixtures with mocked pymqi"""
-        self.config = {
+    @classmethod
+    def setUpClass(cls):
+        """Create the fixtures shared by every test in the class"""
+        cls.config = {
             "host": "localhost",
             "port": 1414,
             "queue_manager": "QM1",
@@ -592,669 +637,435 @@ class TestMQLibraryAdapter(unittest.TestCase):
             "password": "testpass",
             "timeout": 30,
         }
-        self.logger = Mock()
-        self.logger.logger = Mock()
+        cls.logger = Mock()
+        cls.logger.logger = Mock()
+
+        # Descriptor mocks for tests that never inspect them
+        cls._empty_gmo = Mock()
+        cls._empty_md = Mock()
+
+    def setUp(self):
+        """Set up test fixtures with mocked pymqi"""
+        # Tests assert on logger calls, so start each one with a clean record
+        self.logger.reset_mock()
 
         # Mock pymqi module
         self.mock_pymqi = MagicMock()
+        self.mock_pymqi.MQMIError = _MQMIError
 
-        # Setup module patches
-        self.pymqi_patcher = patch.dict("sys.modules", {"pymqi": self.mock_pymqi})
+        # Bind the mocked pymqi into the adapter module
+        self.pymqi_patcher = patch.object(_mq_mod, "pymqi", self.mock_pymqi, create=True)
         self.pymqi_patcher.start()
 
     def tearDown(self):
         """Clean up patches"""
         self.pymqi_patcher.stop()
-        # Clear the module from cache if it was imported
-        if "commonpython.adapters.mq_library_adapter" in sys.modules:
-            del sys.modules["commonpython.adapters.mq_library_adapter"]
+
+    def _connected_adapter(self):
+        """Build an adapter bound to a connected queue manager and a mocked queue"""
+        mock_queue = Mock()
+        mock_qmgr = Mock()
+        mock_qmgr.is_connected = True
+        self.mock_pymqi.Queue.return_value = mock_queue
+        self.mock_pymqi.MD.return_value = self._empty_md
+        self.mock_pymqi.GMO.return_value = self._empty_gmo
+
+        adapter = MQLibraryAdapter(self.config, self.logger)
+        adapter._qmgr = mock_qmgr
+        return adapter, mock_queue
+
+    def _disconnected_adapter(self):
+        """Build an adapter without a queue manager, skipping __init__"""
+        adapter = object.__new__(MQLibraryAdapter)
+        adapter._config = self.config
+        adapter._logger = self.logger
+        adapter._qmgr = None
+        return adapter
 
     def test_initialization_with_library(self):
         """Test adapter initialization when pymqi is available"""
-        with patch("commonpython.adapters.mq_library_adapter.HAS_PYMQI", True):
-            from commonpython.adapters.mq_library_adapter import MQLibraryAdapter
-
-            adapter = MQLibraryAdapter(self.config, self.logger)
-            self.assertIsNotNone(adapter)
-            self.assertEqual(adapter._config, self.config)
-            self.assertEqual(adapter._logger, self.logger)
+        adapter = MQLibraryAdapter(self.config, self.logger)
+        self.assertIsNotNone(adapter)
+        self.assertEqual(adapter._config, self.config)
+        self.assertEqual(adapter._logger, self.logger)
 
     def test_initialization_without_library(self):
         """Test adapter initialization raises ImportError when pymqi not available"""
-        with patch("commonpython.adapters.mq_library_adapter.HAS_PYMQI", False):
-            from commonpython.adapters.mq_library_adapter import MQLibraryAdapter
-
+        with patch.object(_mq_mod, "HAS_PYMQI", False):
             with self.assertRaises(ImportError) as context:
                 MQLibraryAdapter(self.config, self.logger)
             self.assertIn("pymqi library is not installed", str(context.exception))
 
     def test_build_connection_info(self):
         """Test connection info building"""
-        with patch("commonpython.adapters.mq_library_adapter.HAS_PYMQI", True):
-            from commonpython.adapters.mq_library_adapter import MQLibraryAdapter
-
-            adapter = MQLibraryAdapter(self.config, self.logger)
-            conn_info = adapter._connection_info
+        adapter = MQLibraryAdapter(self.config, self.logger)
+        conn_info = adapter._connection_info
 
-            self.assertEqual(conn_info["host"], "localhost")
-            self.assertEqual(conn_info["port"], 1414)
-            self.assertEqual(conn_info["queue_manager"], "QM1")
-            self.assertEqual(conn_info["channel"], "SYSTEM.DEF.SVRCONN")
-            self.assertEqual(conn_info["timeout"], 30)
+        self.assertEqual(conn_info["host"], "localhost")
+        self.assertEqual(conn_info["port"], 1414)
+        self.assertEqual(conn_info["queue_manager"], "QM1")
+        self.assertEqual(conn_info["channel"], "SYSTEM.DEF.SVRCONN")
+        self.assertEqual(conn_info["timeout"], 30)
 
     def test_build_connection_info_defaults(self):
         """Test connection info building with defaults"""
-        with patch("commonpython.adapters.mq_library_adapter.HAS_PYMQI", True):
-            from commonpython.adapters.mq_library_adapter import MQLibraryAdapter
-
-            config = {}
-            adapter = MQLibraryAdapter(config, self.logger)
-            conn_info = adapter._connection_info
+        config = {}
+        adapter = MQLibraryAdapter(config, self.logger)
+        conn_info = adapter._connection_info
 
-            self.assertEqual(conn_info["host"], "localhost")
-            self.assertEqual(conn_info["port"], 1414)
+        self.assertEqual(conn_info["host"], "localhost")
+        self.assertEqual(conn_info["port"], 1414)
 
     def test_connect_success(self):
         """Test successful MQ connection"""
-        with patch("commonpython.adapters.mq_library_adapter.HAS_PYMQI", True):
-            from commonpython.adapters.mq_library_adapter import MQLibraryAdapter
+        mock_qmgr = Mock()
+        self.mock_pymqi.connect.return_value = mock_qmgr
 
-            mock_qmgr = Mock()
-            self.mock_pymqi.connect.return_value = mock_qmgr
+        adapter = MQLibraryAdapter(self.config, self.logger)
+        result = adapter.connect()
 
-            adapter = MQLibraryAdapter(self.config, self.logger)
-            result = adapter.connect()
-
-            self.assertTrue(result)
-            self.assertEqual(adapter._qmgr, mock_qmgr)
-            self.logger.logger.info.assert_called()
+        self.assertTrue(result)
+        self.assertEqual(adapter._qmgr, mock_qmgr)
+        self.logger.logger.info.assert_called()
 
     def test_connect_failure(self):
         """Test MQ connection failure"""
-        with patch("commonpython.adapters.mq_library_adapter.HAS_PYMQI", True):
-            from commonpython.adapters.mq_library_adapter import MQLibraryAdapter
+        self.mock_pymqi.connect.side_effect = Exception("Connection failed")
 
-            self.mock_pymqi.connect.side_effect = Exception("Connection failed")
+        adapter = MQLibraryAdapter(self.config, self.logger)
+        result = adapter.connect()
 
-            adapter = MQLibraryAdapter(self.config, self.logger)
-            result = adapter.connect()
-
-            self.assertFalse(result)
-            self.logger.logger.error.assert_called()
+        self.assertFalse(result)
+        self.logger.logger.error.assert_called()
 
     def test_disconnect_success(self):
         """Test successful disconnection"""
-        with patch("commonpython.adapters.mq_library_adapter.HAS_PYMQI", True):
-            from commonpython.adapters.mq_library_adapter import MQLibraryAdapter
+        mock_qmgr = Mock()
 
-            mock_qmgr = Mock()
+        adapter = MQLibraryAdapter(self.config, self.logger)
+        adapter._qmgr = mock_qmgr
 
-            adapter = MQLibraryAdapter(self.config, self.logger)
-            adapter._qmgr = mock_qmgr
+        adapter.disconnect()
 
-            adapter.disconnect()
-
-            mock_qmgr.disconnect.assert_called_once()
-            self.assertIsNone(adapter._qmgr)
+        mock_qmgr.disconnect.assert_called_once()
+        self.assertIsNone(adapter._qmgr)
 
     def test_disconnect_with_error(self):
         """Test disconnection with error"""
-        with patch("commonpython.adapters.mq_library_adapter.HAS_PYMQI", True):
-            from commonpython.adapters.mq_library_adapter import MQLibraryAdapter
+        mock_qmgr = Mock()
+        mock_qmgr.disconnect.side_effect = Exception("Disconnect failed")
 
-            mock_qmgr = Mock()
-            mock_qmgr.disconnect.side_effect = Exception("Disconnect failed")
+        adapter = MQLibraryAdapter(self.config, self.logger)
+        adapter._qmgr = mock_qmgr
 
-            adapter = MQLibraryAdapter(self.config, self.logger)
-            adapter._qmgr = mock_qmgr
+        adapter.disconnect()
 
-            adapter.disconnect()
-
-            self.logger.logger.error.assert_called()
+        self.logger.logger.error.assert_called()
 
     def test_is_connected_true(self):
         """Test is_connected returns True when connected"""
-        with patch("commonpython.adapters.mq_library_adapter.HAS_PYMQI", True):
-            from commonpython.adapters.mq_library_adapter import MQLibraryAdapter
-
-            mock_qmgr = Mock()
-            mock_qmgr.is_connected = True
+        mock_qmgr = Mock()
+        mock_qmgr.is_connected = True
 
-            adapter = MQLibraryAdapter(self.config, self.logger)
-            adapter._qmgr = mock_qmgr
+        adapter = MQLibraryAdapter(self.config, self.logger)
+        adapter._qmgr = mock_qmgr
 
-            self.assertTrue(adapter.is_connected())
+        self.assertTrue(adapter.is_connected())
 
     def test_is_connected_false(self):
         """Test is_connected returns False when not connected"""
-        with patch("commonpython.adapters.mq_library_adapter.HAS_PYMQI", True):
-            from commonpython.adapters.mq_library_adapter import MQLibraryAdapter
+        adapter = self._disconnected_adapter()
 
-            adapter = MQLibraryAdapter(self.config, self.logger)
-            adapter._qmgr = None
-
-            self.assertFalse(adapter.is_connected())
+        self.assertFalse(adapter.is_connected())
 
     def test_is_connected_exception(self):
         """Test is_connected handles exceptions"""
-        with patch("commonpython.adapters.mq_library_adapter.HAS_PYMQI", True):
-            from commonpython.adapters.mq_library_adapter import MQLibraryAdapter
+        mock_qmgr = Mock()
+        type(mock_qmgr).is_connected = PropertyMock(side_effect=Exception("Check failed"))
 
-            mock_qmgr = Mock()
-            type(mock_qmgr).is_connected = PropertyMock(side_effect=Exception("Check failed"))
+        adapter = MQLibraryAdapter(self.config, self.logger)
+        adapter._qmgr = mock_qmgr
 
-            adapter = MQLibraryAdapter(self.config, self.logger)
-            adapter._qmgr = mock_qmgr
-
-            self.assertFalse(adapter.is_connected())
+        self.assertFalse(adapter.is_connected())
 
-    def test_put_message_string(self):
-        """Test putting string message"""
-        with patch("commonpython.adapters.mq_library_adapter.HAS_PYMQI", True):
-            from commonpython.adapters.mq_library_adapter import MQLibraryAdapter
+    def test_put_message_payload_types(self):
+        """Test putting string, dictionary and bytes messages"""
+        adapter, mock_queue = self._connected_adapter()
 
-            mock_queue = Mock()
-            mock_qmgr = Mock()
-            mock_qmgr.is_connected = True
-            self.mock_pymqi.Queue.return_value = mock_queue
-            self.mock_pymqi.MD.return_value = Mock()
+        for payload in ("test message", {"key": "value"}, b"test bytes"):
+            with self.subTest(payload=type(payload).__name__):
+                mock_queue.reset_mock()
 
-            adapter = MQLibraryAdapter(self.config, self.logger)
-            adapter._qmgr = mock_qmgr
+                result = adapter.put_message("TEST.QUEUE", payload)
 
-            result = adapter.put_message("TEST.QUEUE", "test message")
+                self.assertTrue(result)
+                mock_queue.put.assert_called_once()
+                mock_queue.close.assert_called_once()
 
-            self.assertTrue(result)
-            mock_queue.put.assert_called_once()
-            mock_queue.close.assert_called_once()
-
-    def test_put_message_dict(self):
-        """Test putting dictionary message"""
-        with patch("commonpython.adapters.mq_library_adapter.HAS_PYMQI", True):
-            from commonpython.adapters.mq_library_adapter import MQLibraryAdapter
+    def test_put_message_with_properties(self):
+        """Test putting message with properties"""
+        adapter, _ = self._connected_adapter()
+        mock_md = Mock()
+        self.mock_pymqi.MD.return_value = mock_md
+
+        properties = {
+            "correlation_id": "test_corr_id",
+            "reply_to_queue": "REPLY.QUEUE",
+            "message_type": 8,
+            "priority": 5,
+            "persistence": 1,
+        }
 
-            mock_queue = Mock()
-            mock_qmgr = Mock()
-            mock_qmgr.is_connected = True
-            self.mock_pymqi.Queue.return_value = mock_queue
-            self.mock_pymqi.MD.return_value = Mock()
+        result = adapter.put_message("TEST.QUEUE", "test", properties)
 
-            adapter = MQLibraryAdapter(self.config, self.logger)
-            adapter._qmgr = mock_qmgr
+        self.assertTrue(result)
+        self.assertEqual(mock_md.CorrelId, "test_corr_id")
+        self.assertEqual(mock_md.ReplyToQ, "REPLY.QUEUE")
 
-            result = adapter.put_message("TEST.QUEUE", {"key": "value"})
+    def test_put_message_not_connected(self):
+        """Test putting message when not connected"""
+        adapter = self._disconnected_adapter()
 
-            self.assertTrue(result)
+        with self.assertRaises(Exception) as context:
+            adapter.put_message("TEST.QUEUE", "test")
+        self.assertIn("MQ connection not established", str(context.exception))
 
-    def test_put_message_bytes(self):
-        """Test putting bytes message"""
-        with patch("commonpython.adapters.mq_library_adapter.HAS_PYMQI", True):
-            from commonpython.adapters.mq_library_adapter import MQLibraryAdapter
+    def test_put_message_error(self):
+        """Test putting message with error"""
+        adapter, mock_queue = self._connected_adapter()
+        mock_queue.put.side_effect = Exception("Put failed")
 
-            mock_queue = Mock()
-            mock_qmgr = Mock()
-            mock_qmgr.is_connected = True
-            self.mock_pymqi.Queue.return_value = mock_queue
-            self.mock_pymqi.MD.return_value = Mock()
+        result = adapter.put_message("TEST.QUEUE", "test")
 
-            adapter = MQLibraryAdapter(self.config, self.logger)
-            adapter._qmgr = mock_qmgr
+        self.assertFalse(result)
 
-            result = adapter.put_message("TEST.QUEUE", b"test bytes")
+    def test_get_message_success(self):
+        """Test getting message successfully"""
+        adapter, mock_queue = self._connected_adapter()
 
-            self.assertTrue(result)
+        mock_queue.get.return_value = b'{"key": "value"}'
 
-    def test_put_message_with_properties(self):
-        """Test putting message with properties"""
-        with patch("commonpython.adapters.mq_library_adapter.HAS_PYMQI", True):
-            from commonpython.adapters.mq_library_adapter import MQLibraryAdapter
-
-            mock_queue = Mock()
-            mock_qmgr = Mock()
-            mock_qmgr.is_connected = True
-            mock_md = Mock()
-            self.mock_pymqi.Queue.return_value = mock_queue
-            self.mock_pymqi.MD.return_value = mock_md
-
-            adapter = MQLibraryAdapter(self.config, self.logger)
-            adapter._qmgr = mock_qmgr
-
-            properties = {
-                "correlation_id": "test_corr_id",
-                "reply_to_queue": "REPLY.QUEUE",
-                "message_type": 8,
-                "priority": 5,
-                "persistence": 1,
+        mock_md = SimpleNamespace(
+            **{
+                **_MD_DEFAULTS,
+                "CorrelId": b"\x05\x06\x07\x08",
+                "ReplyToQ": b"REPLY.QUEUE         ",
+                "ReplyToQMgr": b"QM2                  ",
+                "Priority": 5,
             }
+        )
 
-            result = adapter.put_message("TEST.QUEUE", "test", properties)
-
-            self.assertTrue(result)
-            self.assertEqual(mock_md.CorrelId, "test_corr_id")
-            self.assertEqual(mock_md.ReplyToQ, "REPLY.QUEUE")
-
-    def test_put_message_not_connected(self):
-        """Test putting message when not connected"""
-        with patch("commonpython.adapters.mq_library_adapter.HAS_PYMQI", True):
-            from commonpython.adapters.mq_library_adapter import MQLibraryAdapter
+        self.mock_pymqi.MD.return_value = mock_md
+        self.mock_pymqi.CMQC = Mock()
+        self.mock_pymqi.CMQC.MQGMO_WAIT = 1
+        self.mock_pymqi.CMQC.MQGMO_FAIL_IF_QUIESCING = 2
 
-            adapter = MQLibraryAdapter(self.config, self.logger)
+        message = adapter.get_message("TEST.QUEUE")
 
-            with self.assertRaises(Exception) as context:
-                adapter.put_message("TEST.QUEUE", "test")
-            self.assertIn("MQ connection not established", str(context.exception))
-
-    def test_put_message_error(self):
-        """Test putting message with error"""
-        with patch("commonpython.adapters.mq_library_adapter.HAS_PYMQI", True):
-            from commonpython.adapters.mq_library_adapter import MQLibraryAdapter
+        self.assertIsNotNone(message)
+        self.assertEqual(message["data"]["key"], "value")
 
-            mock_queue = Mock()
-            mock_queue.put.side_effect = Exception("Put failed")
-            mock_qmgr = Mock()
-            mock_qmgr.is_connected = True
-            self.mock_pymqi.Queue.return_value = mock_queue
-            self.mock_pymqi.MD.return_value = Mock()
+    def test_get_message_string(self):
+        """Test getting string message"""
+        adapter, mock_queue = self._connected_adapter()
 
-            adapter = MQLibraryAdapter(self.config, self.logger)
-            adapter._qmgr = mock_qmgr
+        mock_queue.get.return_value = b"plain text message"
 
-            result = adapter.put_message("TEST.QUEUE", "test")
+        mock_md = SimpleNamespace(**{**_MD_DEFAULTS, "PutTime": "12345678", "PutDate": "20240101"})
 
-            self.assertFalse(result)
+        self.mock_pymqi.MD.return_value = mock_md
+        self.mock_pymqi.CMQC = Mock()
+        self.mock_pymqi.CMQC.MQGMO_WAIT = 1
+        self.mock_pymqi.CMQC.MQGMO_FAIL_IF_QUIESCING = 2
 
-    def test_get_message_success(self):
-        """Test getting message successfully"""
-        with patch("commonpython.adapters.mq_library_adapter.HAS_PYMQI", True):
-            from commonpython.adapters.mq_library_adapter import MQLibraryAdapter
-
-            mock_queue = Mock()
-            mock_queue.get.return_value = b'{"key": "value"}'
-
-            mock_md = Mock()
-            mock_md.MsgId = b"\x01\x02\x03\x04"
-            mock_md.CorrelId = b"\x05\x06\x07\x08"
-            mock_md.ReplyToQ = b"REPLY.QUEUE         "
-            mock_md.ReplyToQMgr = b"QM2                  "
-            mock_md.MsgType = 8
-            mock_md.Format = b"MQSTR   "
-            mock_md.Priority = 5
-            mock_md.Persistence = 1
-            mock_md.Expiry = -1
-            mock_md.PutTime = b"12345678"
-            mock_md.PutDate = b"20240101"
-
-            mock_qmgr = Mock()
-            mock_qmgr.is_connected = True
-            self.mock_pymqi.Queue.return_value = mock_queue
-            self.mock_pymqi.MD.return_value = mock_md
-            self.mock_pymqi.GMO.return_value = Mock()
-            self.mock_pymqi.CMQC = Mock()
-            self.mock_pymqi.CMQC.MQGMO_WAIT = 1
-            self.mock_pymqi.CMQC.MQGMO_FAIL_IF_QUIESCING = 2
-
-            adapter = MQLibraryAdapter(self.config, self.logger)
-            adapter._qmgr = mock_qmgr
-
-            message = adapter.get_message("TEST.QUEUE")
-
-            self.assertIsNotNone(message)
-            self.assertEqual(message["data"]["key"], "value")
+        message = adapter.get_message("TEST.QUEUE")
 
-    def test_get_message_string(self):
-        """Test getting string message"""
-        with patch("commonpython.adapters.mq_library_adapter.HAS_PYMQI", True):
-            from commonpython.adapters.mq_library_adapter import MQLibraryAdapter
-
-            mock_queue = Mock()
-            mock_queue.get.return_value = b"plain text message"
-
-            mock_md = Mock()
-            mock_md.MsgId = b"\x01\x02\x03\x04"
-            mock_md.CorrelId = b""
-            mock_md.ReplyToQ = b""
-            mock_md.ReplyToQMgr = b""
-            mock_md.MsgType = 8
-            mock_md.Format = b"MQSTR   "
-            mock_md.Priority = 0
-            mock_md.Persistence = 1
-            mock_md.Expiry = -1
-            mock_md.PutTime = "12345678"
-            mock_md.PutDate = "20240101"
-
-            mock_qmgr = Mock()
-            mock_qmgr.is_connected = True
-            self.mock_pymqi.Queue.return_value = mock_queue
-            self.mock_pymqi.MD.return_value = mock_md
-            self.mock_pymqi.GMO.return_value = Mock()
-            self.mock_pymqi.CMQC = Mock()
-            self.mock_pymqi.CMQC.MQGMO_WAIT = 1
-            self.mock_pymqi.CMQC.MQGMO_FAIL_IF_QUIESCING = 2
-
-            adapter = MQLibraryAdapter(self.config, self.logger)
-            adapter._qmgr = mock_qmgr
-
-            message = adapter.get_message("TEST.QUEUE")
-
-            self.assertIsNotNone(message)
-            self.assertEqual(message["data"], "plain text message")
+        self.assertIsNotNone(message)
+        self.assertEqual(message["data"], "plain text message")
 
     def test_get_message_no_message_available(self):
         """Test getting message when queue is empty"""
-        with patch("commonpython.adapters.mq_library_adapter.HAS_PYMQI", True):
-            from commonpython.adapters.mq_library_adapter import MQLibraryAdapter
+        adapter, mock_queue = self._connected_adapter()
 
-            mock_queue = Mock()
-            mqmi_error = Exception("No message")
-            mqmi_error.comp = self.mock_pymqi.CMQC.MQCC_FAILED
-            mqmi_error.reason = self.mock_pymqi.CMQC.MQRC_NO_MSG_AVAILABLE
-            mock_queue.get.side_effect = self.mock_pymqi.MQMIError(mqmi_error)
+        self.mock_pymqi.CMQC = Mock()
+        self.mock_pymqi.CMQC.MQCC_FAILED = 2
+        self.mock_pymqi.CMQC.MQRC_NO_MSG_AVAILABLE = 2033
 
-            self.mock_pymqi.MQMIError = type("MQMIError", (Exception,), {})
-            self.mock_pymqi.CMQC = Mock()
-            self.mock_pymqi.CMQC.MQCC_FAILED = 2
-            self.mock_pymqi.CMQC.MQRC_NO_MSG_AVAILABLE = 2033
+        mock_error = _MQMIError()
+        mock_error.comp = 2
+        mock_error.reason = 2033
+        mock_queue.get.side_effect = mock_error
 
-            mock_error = self.mock_pymqi.MQMIError()
-            mock_error.comp = 2
-            mock_error.reason = 2033
-            mock_queue.get.side_effect = mock_error
+        self.mock_pymqi.CMQC.MQGMO_WAIT = 1
+        self.mock_pymqi.CMQC.MQGMO_FAIL_IF_QUIESCING = 2
 
-            mock_qmgr = Mock()
-            mock_qmgr.is_connected = True
-            self.mock_pymqi.Queue.return_value = mock_queue
-            self.mock_pymqi.MD.return_value = Mock()
-            self.mock_pymqi.GMO.return_value = Mock()
-            self.mock_pymqi.CMQC.MQGMO_WAIT = 1
-            self.mock_pymqi.CMQC.MQGMO_FAIL_IF_QUIESCING = 2
+        message = adapter.get_message("TEST.QUEUE")
 
-            adapter = MQLibraryAdapter(self.config, self.logger)
-            adapter._qmgr = mock_qmgr
-
-            message = adapter.get_message("TEST.QUEUE")
-
-            self.assertIsNone(message)
+        self.assertIsNone(message)
 
     def test_get_message_error(self):
         """Test getting message with error"""
-        with patch("commonpython.adapters.mq_library_adapter.HAS_PYMQI", True):
-            from commonpython.adapters.mq_library_adapter import MQLibraryAdapter
+        adapter, mock_queue = self._connected_adapter()
 
-            mock_queue = Mock()
-            mock_queue.get.side_effect = Exception("Get failed")
+        mock_queue.get.side_effect = Exception("Get failed")
 
-            mock_qmgr = Mock()
-            mock_qmgr.is_connected = True
-            self.mock_pymqi.Queue.return_value = mock_queue
-            self.mock_pymqi.MD.return_value = Mock()
-            self.mock_pymqi.GMO.return_value = Mock()
-            self.mock_pymqi.CMQC = Mock()
-            self.mock_pymqi.CMQC.MQGMO_WAIT = 1
-            self.mock_pymqi.CMQC.MQGMO_FAIL_IF_QUIESCING = 2
-
-            adapter = MQLibraryAdapter(self.config, self.logger)
-            adapter._qmgr = mock_qmgr
-
-            with self.assertRaises(Exception):
-                adapter.get_message("TEST.QUEUE")
+        with self.assertRaises(Exception):
+            adapter.get_message("TEST.QUEUE")
 
     def test_browse_message_success(self):
         """Test browsing message successfully"""
-        with patch("commonpython.adapters.mq_library_adapter.HAS_PYMQI", True):
-            from commonpython.adapters.mq_library_adapter import MQLibraryAdapter
-
-            mock_queue = Mock()
-            mock_queue.get.return_value = b'{"key": "value"}'
-
-            mock_md = Mock()
-            mock_md.MsgId = b"\x01\x02\x03\x04"
-            mock_md.CorrelId = b""
-            mock_md.ReplyToQ = b"REPLY.QUEUE         "
-            mock_md.MsgType = 8
-            mock_md.Format = b"MQSTR   "
-            mock_md.Priority = 5
-            mock_md.Persistence = 1
-
-            mock_qmgr = Mock()
-            mock_qmgr.is_connected = True
-            self.mock_pymqi.Queue.return_value = mock_queue
-            self.mock_pymqi.MD.return_value = mock_md
-            self.mock_pymqi.GMO.return_value = Mock()
-            self.mock_pymqi.CMQC = Mock()
-            self.mock_pymqi.CMQC.MQOO_BROWSE = 8
-            self.mock_pymqi.CMQC.MQGMO_BROWSE_FIRST = 16
-            self.mock_pymqi.CMQC.MQGMO_FAIL_IF_QUIESCING = 2
-
-            adapter = MQLibraryAdapter(self.config, self.logger)
-            adapter._qmgr = mock_qmgr
-
-            message = adapter.browse_message("TEST.QUEUE")
-
-            self.assertIsNotNone(message)
-            self.assertEqual(message["data"]["key"], "value")
+        adapter, mock_queue = self._connected_adapter()
+
+        mock_queue.get.return_value = b'{"key": "value"}'
+
+        mock_md = SimpleNamespace(
+            **{**_MD_DEFAULTS, "ReplyToQ": b"REPLY.QUEUE         ", "Priority": 5}
+        )
+
+        self.mock_pymqi.MD.return_value = mock_md
+        self.mock_pymqi.CMQC = Mock()
+        self.mock_pymqi.CMQC.MQOO_BROWSE = 8
+        self.mock_pymqi.CMQC.MQGMO_BROWSE_FIRST = 16
+        self.mock_pymqi.CMQC.MQGMO_FAIL_IF_QUIESCING = 2
+
+        message = adapter.browse_message("TEST.QUEUE")
+
+        self.assertIsNotNone(message)
+        self.assertEqual(message["data"]["key"], "value")
 
     def test_browse_message_with_message_id(self):
         """Test browsing specific message by ID"""
-        with patch("commonpython.adapters.mq_library_adapter.HAS_PYMQI", True):
-            from commonpython.adapters.mq_library_adapter import MQLibraryAdapter
-
-            mock_queue = Mock()
-            mock_queue.get.return_value = b"test message"
-
-            mock_md = Mock()
-            mock_md.MsgId = b"\x01\x02\x03\x04"
-            mock_md.CorrelId = b""
-            mock_md.ReplyToQ = b""
-            mock_md.MsgType = 8
-            mock_md.Format = b"MQSTR   "
-            mock_md.Priority = 0
-            mock_md.Persistence = 1
-
-            mock_qmgr = Mock()
-            mock_qmgr.is_connected = True
-            self.mock_pymqi.Queue.return_value = mock_queue
-            self.mock_pymqi.MD.return_value = mock_md
-            self.mock_pymqi.GMO.return_value = Mock()
-            self.mock_pymqi.CMQC = Mock()
-            self.mock_pymqi.CMQC.MQOO_BROWSE = 8
-            self.mock_pymqi.CMQC.MQGMO_BROWSE_FIRST = 16
-            self.mock_pymqi.CMQC.MQGMO_FAIL_IF_QUIESCING = 2
-
-            adapter = MQLibraryAdapter(self.config, self.logger)
-            adapter._qmgr = mock_qmgr
-
-            message = adapter.browse_message("TEST.QUEUE", b"\x01\x02\x03\x04")
-
-            self.assertIsNotNone(message)
-            self.assertEqual(mock_md.MsgId, b"\x01\x02\x03\x04")
+        adapter, mock_queue = self._connected_adapter()
 
-    def test_browse_message_no_message(self):
-        """Test browsing when no message available"""
-        with patch("commonpython.adapters.mq_library_adapter.HAS_PYMQI", True):
-            from commonpython.adapters.mq_library_adapter import MQLibraryAdapter
+        mock_queue.get.return_value = b"test message"
 
-            mock_queue = Mock()
+        mock_md = SimpleNamespace(**_MD_DEFAULTS)
 
-            self.mock_pymqi.MQMIError = type("MQMIError", (Exception,), {})
-            self.mock_pymqi.CMQC = Mock()
-            self.mock_pymqi.CMQC.MQCC_FAILED = 2
-            self.mock_pymqi.CMQC.MQRC_NO_MSG_AVAILABLE = 2033
-            self.mock_pymqi.CMQC.MQOO_BROWSE = 8
-            self.mock_pymqi.CMQC.MQGMO_BROWSE_FIRST = 16
-            self.mock_pymqi.CMQC.MQGMO_FAIL_IF_QUIESCING = 2
+        self.mock_pymqi.MD.return_value = mock_md
+        self.mock_pymqi.CMQC = Mock()
+        self.mock_pymqi.CMQC.MQOO_BROWSE = 8
+        self.mock_pymqi.CMQC.MQGMO_BROWSE_FIRST = 16
+        self.mock_pymqi.CMQC.MQGMO_FAIL_IF_QUIESCING = 2
 
-            mock_error = self.mock_pymqi.MQMIError()
-            mock_error.comp = 2
-            mock_error.reason = 2033
-            mock_queue.get.side_effect = mock_error
+        message = adapter.browse_message("TEST.QUEUE", b"\x01\x02\x03\x04")
 
-            mock_qmgr = Mock()
-            mock_qmgr.is_connected = True
-            self.mock_pymqi.Queue.return_value = mock_queue
-            self.mock_pymqi.MD.return_value = Mock()
-            self.mock_pymqi.GMO.return_value = Mock()
+        self.assertIsNotNone(message)
+        self.assertEqual(mock_md.MsgId, b"\x01\x02\x03\x04")
 
-            adapter = MQLibraryAdapter(self.config, self.logger)
-            adapter._qmgr = mock_qmgr
+    def test_browse_message_no_message(self):
+        """Test browsing when no message available"""
+        adapter, mock_queue = self._connected_adapter()
 
-            message = adapter.browse_message("TEST.QUEUE")
+        self.mock_pymqi.CMQC = Mock()
+        self.mock_pymqi.CMQC.MQCC_FAILED = 2
+        self.mock_pymqi.CMQC.MQRC_NO_MSG_AVAILABLE = 2033
+        self.mock_pymqi.CMQC.MQOO_BROWSE = 8
+        self.mock_pymqi.CMQC.MQGMO_BROWSE_FIRST = 16
+        self.mock_pymqi.CMQC.MQGMO_FAIL_IF_QUIESCING = 2
 
-            self.assertIsNone(message)
+        mock_error = _MQMIError()
+        mock_error.comp = 2
+        mock_error.reason = 2033
+        mock_queue.get.side_effect = mock_error
+
+        message = adapter.browse_message("TEST.QUEUE")
+
+        self.assertIsNone(message)
 
     def test_browse_message_method_exists(self):
         """Test that browse_message method exists and is callable"""
-        with patch("commonpython.adapters.mq_library_adapter.HAS_PYMQI", True):
-            from commonpython.adapters.mq_library_adapter import MQLibraryAdapter
-
-            adapter = MQLibraryAdapter(self.config, self.logger)
-            # Verify the adapter has browse_message method
-            self.assertTrue(hasattr(adapter, "browse_message"))
-            self.assertTrue(callable(adapter.browse_message))
+        adapter = MQLibraryAdapter(self.config, self.logger)
+        # Verify the adapter has browse_message method
+        self.assertTrue(hasattr(adapter, "browse_message"))
+        self.assertTrue(callable(adapter.browse_message))
 
     def test_get_queue_depth_success(self):
         """Test getting queue depth successfully"""
-        with patch("commonpython.adapters.mq_library_adapter.HAS_PYMQI", True):
-            from commonpython.adapters.mq_library_adapter import MQLibraryAdapter
-
-            mock_queue = Mock()
-            mock_queue.inquire.return_value = 42
+        adapter, mock_queue = self._connected_adapter()
 
-            mock_qmgr = Mock()
-            mock_qmgr.is_connected = True
-            self.mock_pymqi.Queue.return_value = mock_queue
-            self.mock_pymqi.CMQC = Mock()
-            self.mock_pymqi.CMQC.MQOO_INQUIRE = 32
-            self.mock_pymqi.CMQC.MQIA_CURRENT_Q_DEPTH = 3
+        mock_queue.inquire.return_value = 42
 
-            adapter = MQLibraryAdapter(self.config, self.logger)
-            adapter._qmgr = mock_qmgr
+        self.mock_pymqi.CMQC = Mock()
+        self.mock_pymqi.CMQC.MQOO_INQUIRE = 32
+        self.mock_pymqi.CMQC.MQIA_CURRENT_Q_DEPTH = 3
 
-            depth = adapter.get_queue_depth("TEST.QUEUE")
+        depth = adapter.get_queue_depth("TEST.QUEUE")
 
-            self.assertEqual(depth, 42)
+        self.assertEqual(depth, 42)
 
     def test_get_queue_depth_error(self):
         """Test getting queue depth with error"""
-        with patch("commonpython.adapters.mq_library_adapter.HAS_PYMQI", True):
-            from commonpython.adapters.mq_library_adapter import MQLibraryAdapter
+        adapter, mock_queue = self._connected_adapter()
 
-            mock_queue = Mock()
-            mock_queue.inquire.side_effect = Exception("Inquire failed")
+        mock_queue.inquire.side_effect = Exception("Inquire failed")
 
-            mock_qmgr = Mock()
-            mock_qmgr.is_connected = True
-            self.mock_pymqi.Queue.return_value = mock_queue
-            self.mock_pymqi.CMQC = Mock()
-            self.mock_pymqi.CMQC.MQOO_INQUIRE = 32
-            self.mock_pymqi.CMQC.MQIA_CURRENT_Q_DEPTH = 3
+        depth = adapter.get_queue_depth("TEST.QUEUE")
 
-            adapter = MQLibraryAdapter(self.config, self.logger)
-            adapter._qmgr = mock_qmgr
-
-            depth = adapter.get_queue_depth("TEST.QUEUE")
-
-            self.assertEqual(depth, -1)
+        self.assertEqual(depth, -1)
 
     def test_purge_queue_success(self):
         """Test purging queue successfully"""
-        with patch("commonpython.adapters.mq_library_adapter.HAS_PYMQI", True):
-            from commonpython.adapters.mq_library_adapter import MQLibraryAdapter
-
-            mock_queue = Mock()
+        adapter, mock_queue = self._connected_adapter()
 
-            # Simulate 3 messages then no more messages
-            self.mock_pymqi.MQMIError = type("MQMIError", (Exception,), {})
-            self.mock_pymqi.CMQC = Mock()
-            self.mock_pymqi.CMQC.MQGMO_NO_WAIT = 4
-            self.mock_pymqi.CMQC.MQGMO_FAIL_IF_QUIESCING = 2
-            self.mock_pymqi.CMQC.MQRC_NO_MSG_AVAILABLE = 2033
+        # Simulate 3 messages then no more messages
+        self.mock_pymqi.CMQC = Mock()
+        self.mock_pymqi.CMQC.MQGMO_NO_WAIT = 4
+        self.mock_pymqi.CMQC.MQGMO_FAIL_IF_QUIESCING = 2
+        self.mock_pymqi.CMQC.MQRC_NO_MSG_AVAILABLE = 2033
 
-            no_msg_error = self.mock_pymqi.MQMIError()
-            no_msg_error.reason = 2033
+        no_msg_error = _MQMIError()
+        no_msg_error.reason = 2033
 
-            mock_queue.get.side_effect = [b"msg1", b"msg2", b"msg3", no_msg_error]
+        mock_queue.get.side_effect = [b"msg1", b"msg2", b"msg3", no_msg_error]
 
-            mock_qmgr = Mock()
-            mock_qmgr.is_connected = True
-            self.mock_pymqi.Queue.return_value = mock_queue
-            self.mock_pymqi.MD.return_value = Mock()
-            self.mock_pymqi.GMO.return_value = Mock()
+        count = adapter.purge_queue("TEST.QUEUE")
 
-            adapter = MQLibraryAdapter(self.config, self.logger)
-            adapter._qmgr = mock_qmgr
-
-            count = adapter.purge_queue("TEST.QUEUE")
-
-            self.assertEqual(count, 3)
+        self.assertEqual(count, 3)
 
     def test_purge_queue_error(self):
         """Test purging queue with error"""
-        with patch("commonpython.adapters.mq_library_adapter.HAS_PYMQI", True):
-            from commonpython.adapters.mq_library_adapter import MQLibraryAdapter
+        adapter, mock_queue = self._connected_adapter()
 
-            mock_queue = Mock()
-            mock_queue.get.side_effect = Exception("Purge failed")
+        mock_queue.get.side_effect = Exception("Purge failed")
 
-            mock_qmgr = Mock()
-            mock_qmgr.is_connected = True
-            self.mock_pymqi.Queue.return_value = mock_queue
-            self.mock_pymqi.MD.return_value = Mock()
-            self.mock_pymqi.GMO.return_value = Mock()
-            self.mock_pymqi.CMQC = Mock()
-            self.mock_pymqi.CMQC.MQGMO_NO_WAIT = 4
-            self.mock_pymqi.CMQC.MQGMO_FAIL_IF_QUIESCING = 2
-
-            adapter = MQLibraryAdapter(self.config, self.logger)
-            adapter._qmgr = mock_qmgr
-
-            with self.assertRaises(Exception):
-                adapter.purge_queue("TEST.QUEUE")
+        with self.assertRaises(Exception):
+            adapter.purge_queue("TEST.QUEUE")
 
     def test_test_connection_success(self):
         """Test connection test success"""
-        with patch("commonpython.adapters.mq_library_adapter.HAS_PYMQI", True):
-            from commonpython.adapters.mq_library_adapter import MQLibraryAdapter
-
-            mock_pcf = Mock()
-            mock_pcf.MQCMD_INQUIRE_Q_MGR.return_value = True
-            self.mock_pymqi.PCFExecute.return_value = mock_pcf
+        mock_pcf = Mock()
+        mock_pcf.MQCMD_INQUIRE_Q_MGR.return_value = True
+        self.mock_pymqi.PCFExecute.return_value = mock_pcf
 
-            mock_qmgr = Mock()
+        mock_qmgr = Mock()
 
-            adapter = MQLibraryAdapter(self.config, self.logger)
-            adapter._qmgr = mock_qmgr
+        adapter = MQLibraryAdapter(self.config, self.logger)
+        adapter._qmgr = mock_qmgr
 
-            result = adapter.test_connection()
+        result = adapter.test_connection()
 
-            self.assertTrue(result)
+        self.assertTrue(result)
 
     def test_test_connection_no_qmgr(self):
         """Test connection test when no qmgr"""
-        with patch("commonpython.adapters.mq_library_adapter.HAS_PYMQI", True):
-            from commonpython.adapters.mq_library_adapter import MQLibraryAdapter
-
-            adapter = MQLibraryAdapter(self.config, self.logger)
-            adapter._qmgr = None
+        adapter = self._disconnected_adapter()
 
-            result = adapter.test_connection()
+        result = adapter.test_connection()
 
-            self.assertFalse(result)
+        self.assertFalse(result)
 
     def test_test_connection_failure(self):
         """Test connection test failure"""
-        with patch("commonpython.adapters.mq_library_adapter.HAS_PYMQI", True):
-            from commonpython.adapters.mq_library_adapter import MQLibraryAdapter
+        self.mock_pymqi.PCFExecute.side_effect = Exception("Test failed")
 
-            self.mock_pymqi.PCFExecute.side_effect = Exception("Test failed")
+        mock_qmgr = Mock()
 
-            mock_qmgr = Mock()
+        adapter = MQLibraryAdapter(self.config, self.logger)
+        adapter._qmgr = mock_qmgr
 
-            adapter = MQLibraryAdapter(self.config, self.logger)
-            adapter._qmgr = mock_qmgr
+        result = adapter.test_connection()
 
-            result = adapter.test_connection()
-
-            self.assertFalse(result)
+        self.assertFalse(result)
 
 
 if __name__ == "__main__":
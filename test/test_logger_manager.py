@@ -4,42 +4,56 @@ Test cases for LoggerManager
 Tests logging functionality using only standard Python modules.
 """
 
+import collections
+import dataclasses
+import enum
+import io
 import json
 import logging
+import logging.handlers
 import os
 import sys
 import tempfile
-import time
+import threading
 import unittest
+from datetime import datetime
 from pathlib import Path
-from unittest.mock import MagicMock
+from unittest.mock import patch
 
 # Add the parent directory to the path to import the module
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from commonpython.logging.logger_manager import (  # noqa: E402
+    DEFAULT_FORMAT,
+    HAS_ORJSON,
     ColoredFormatter,
     JSONFormatter,
     LoggerManager,
+    _stop_listeners,
 )
 
+# Shared LogRecord arguments for formatter tests; callers supply the level
+_RECORD_KWARGS = {
+    "name": "test",
+    "pathname": "test.py",
+    "lineno": 1,
+    "msg": "Test message",
+    "args": (),
+    "exc_info": None,
+}
 
-def safe_remove(filepath, retries=5, delay=0.2):
-    """Try to remove a file with retries to avoid Windows PermissionError."""
-    for _ in range(retries):
-        try:
-            os.remove(filepath)
-            return
-        except PermissionError:
-            time.sleep(delay)
-    # Last attempt
-    try:
-        os.remove(filepath)
-    except PermissionError:
-        if sys.platform.startswith("win"):
-            pass  # Skip deletion on Windows if still locked
-        else:
-            raise
+
+def _make_memory_logger(config=None):
+    """
+    Create a LoggerManager that writes JSON records to an in-memory buffer.
+
+    @param config Extra logging configuration
+    @return Tuple of (LoggerManager, StringIO buffer)
+    """
+    buf = io.StringIO()
+    logger_config = {"console": False, "json_format": True, "stream": buf}
+    logger_config.update(config or {})
+    return LoggerManager("test", logger_config), buf
 
 
 class TestLoggerManager(unittest.TestCase):
@@ -56,8 +70,7 @@ class TestLoggerManager(unittest.TestCase):
         @brief Initialize test environment before each test.
         """
         # Clear any existing handlers
-        for handler in logging.root.handlers[:]:
-            logging.root.removeHandler(handler)
+        logging.root.handlers.clear()
 
     def test_init_default(self):
         """
@@ -87,17 +100,11 @@ class TestLoggerManager(unittest.TestCase):
 
         @brief Test LoggerManager initialization with custom configuration.
         """
-        config = {"level": "DEBUG", "dir": "log", "file": "test.log"}
-        logger_manager = LoggerManager("test", config)
-        self.assertEqual(logger_manager.config, config)
-        handlers = logger_manager.logger.handlers[:]
-        for handler in handlers:
-            handler.close()
-            logger_manager.logger.removeHandler(handler)
-        import gc
-
-        gc.collect()
-        safe_remove(os.path.join("log", "test.log"))
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config = {"level": "DEBUG", "dir": temp_dir, "file": "test.log"}
+            logger_manager = LoggerManager("test", config)
+            self.assertEqual(logger_manager.config, config)
+            logger_manager.close()
 
     def test_get_logger(self):
         """
@@ -146,8 +153,6 @@ class TestLoggerManager(unittest.TestCase):
         """
         @brief Test JSONFormatter with unserializable object (should fallback to str).
         """
-        import logging
-
         formatter = JSONFormatter()
         # Create a real LogRecord with unserializable msg
         record = logging.LogRecord(
@@ -164,101 +169,205 @@ class TestLoggerManager(unittest.TestCase):
         except Exception:
             self.fail("JSONFormatter raised unexpectedly!")
 
-    def test_colored_formatter_error(self):
-        """
-        Test ColoredFormatter with missing color.
-        """
-        formatter = ColoredFormatter()
-        record = MagicMock()
-        record.levelname = "NOTALEVEL"
-        record.getMessage.return_value = "msg"
-        # Should not raise
-        try:
-            formatter.format(record)
-        except Exception:
-            self.fail("ColoredFormatter raised unexpectedly!")
-
-    def test_log_function_call(self):
-        """
-        Test logging function calls.
-
-        @brief Test logging of function call details.
-        """
-        with tempfile.NamedTemporaryFile(mode="w", delete=False) as f:
-            temp_file = f.name
-        config = {"file": temp_file, "json_format": True}
-        logger_manager = LoggerManager("test", config)
-        logger_manager.log_function_call(
-            "test_function",
-            func_args=(1, 2),
-            func_kwargs={"key": "value"},
-            result="success",
-            duration=0.5,
-        )
-        handlers = logger_manager.logger.handlers[:]
-        for handler in handlers:
-            handler.close()
-            logger_manager.logger.removeHandler(handler)
-        import gc
-
-        gc.collect()
-        with open(temp_file) as f:
-            log_content = f.read()
-            self.assertIn("function_call", log_content)
-            self.assertIn("test_function", log_content)
-        safe_remove(temp_file)
-
-    def test_log_database_operation(self):
-        """
-        Test logging database operations.
-
-        @brief Test logging of database operation details.
-        """
-        with tempfile.NamedTemporaryFile(mode="w", delete=False) as f:
-            temp_file = f.name
-        config = {"file": temp_file, "json_format": True}
-        logger_manager = LoggerManager("test", config)
-        logger_manager.log_database_operation(
-            "SELECT", table="users", query="SELECT * FROM users", duration=0.1, rows_affected=5
-        )
-        handlers = logger_manager.logger.handlers[:]
-        for handler in handlers:
-            handler.close()
-            logger_manager.logger.removeHandler(handler)
-        import gc
-
-        gc.collect()
-        with open(temp_file) as f:
-            log_content = f.read()
-            self.assertIn("database_operation", log_content)
-            self.assertIn("SELECT", log_content)
-        safe_remove(temp_file)
-
-    def test_log_mq_operation(self):
-        """
-        Test logging MQ operations.
-
-        @brief Test logging of MQ operation details.
-        """
-        with tempfile.NamedTemporaryFile(mode="w", delete=False) as f:
-            temp_file = f.name
-        config = {"file": temp_file, "json_format": True}
-        logger_manager = LoggerManager("test", config)
-        logger_manager.log_mq_operation(
-            "PUT", queue="test_queue", message_id="msg123", message_size=100, duration=0.05
-        )
-        handlers = logger_manager.logger.handlers[:]
-        for handler in handlers:
-            handler.close()
-            logger_manager.logger.removeHandler(handler)
-        import gc
-
-        gc.collect()
-        with open(temp_file) as f:
-            log_content = f.read()
-            self.assertIn("mq_operation", log_content)
-            self.assertIn("PUT", log_content)
-        safe_remove(temp_file)
+    def test_log_operations(self):
+        """
+        Test the structured operation logging helpers.
+
+        @brief Test logging of function call, database and MQ operation details.
+        """
+        cases = [
+            (
+                "log_function_call",
+                ("test_function",),
+                {
+                    "func_args": (1, 2),
+                    "func_kwargs": {"key": "value"},
+                    "result": "success",
+                    "duration": 0.5,
+                },
+                ["function_call", "test_function"],
+            ),
+            (
+                "log_database_operation",
+                ("SELECT",),
+                {
+                    "table": "users",
+                    "query": "SELECT * FROM users",
+                    "duration": 0.1,
+                    "rows_affected": 5,
+                },
+                ["database_operation", "SELECT"],
+            ),
+            (
+                "log_mq_operation",
+                ("PUT",),
+                {
+                    "queue": "test_queue",
+                    "message_id": "msg123",
+                    "message_size": 100,
+                    "duration": 0.05,
+                },
+                ["mq_operation", "PUT"],
+            ),
+        ]
+        logger_manager, buf = _make_memory_logger()
+        for method_name, args, kwargs, expected in cases:
+            with self.subTest(method=method_name):
+                buf.seek(0)
+                buf.truncate()
+                getattr(logger_manager, method_name)(*args, **kwargs)
+                log_content = buf.getvalue()
+                for text in expected:
+                    self.assertIn(text, log_content)
+        logger_manager.close()
+
+    def test_buffered_file_logging(self):
+        """
+        Test buffered file handler flushing.
+
+        @brief Test that records are held in memory until flushed.
+        """
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_file = os.path.join(temp_dir, "test.log")
+            config = {"file": temp_file, "console": False, "buffer_size": 10}
+            logger_manager = LoggerManager("test", config)
+            self.assertIsInstance(logger_manager.logger.handlers[0], logging.handlers.MemoryHandler)
+            logger_manager.logger.info("buffered_message")
+            with open(temp_file) as f:
+                self.assertEqual(f.read(), "")
+            logger_manager.flush()
+            with open(temp_file) as f:
+                self.assertIn("buffered_message", f.read())
+            logger_manager.close()
+
+    def test_reinit_flushes_buffered_records(self):
+        """
+        Test re-creating a buffered file logger under the same name.
+
+        @brief Test that records buffered by the earlier manager are written, not dropped.
+        """
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_file = os.path.join(temp_dir, "test.log")
+            config = {"file": temp_file, "console": False, "buffer_size": 10}
+            first = LoggerManager("test", config)
+            first.logger.info("first_message")
+            second = LoggerManager("test", config)
+            with open(temp_file) as f:
+                self.assertIn("first_message", f.read())
+            second.close()
+
+    def test_close_replaced_manager(self):
+        """
+        Test closing a manager after another took over its logger.
+
+        @brief Test that close() removes only the handlers the manager itself attached.
+        """
+        first, _ = _make_memory_logger()
+        second, buf = _make_memory_logger()
+        first.close()
+        self.assertEqual(len(second.logger.handlers), 1)
+        second.logger.info("still_logging")
+        self.assertIn("still_logging", buf.getvalue())
+        second.close()
+        self.assertEqual(second.logger.handlers, [])
+
+    def test_unbuffered_file_logging(self):
+        """
+        Test file handler without buffering.
+
+        @brief Test that by default the file handler is attached directly.
+        """
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_file = os.path.join(temp_dir, "test.log")
+            config = {"file": temp_file, "console": False}
+            logger_manager = LoggerManager("test", config)
+            self.assertIsInstance(
+                logger_manager.logger.handlers[0], logging.handlers.RotatingFileHandler
+            )
+            logger_manager.close()
+
+    def test_async_logging(self):
+        """
+        Test logging through the background queue listener.
+
+        @brief Test that records reach the file handler when async dispatch is enabled.
+        """
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_file = os.path.join(temp_dir, "test.log")
+            config = {"file": temp_file, "json_format": True, "console": False, "async": True}
+            logger_manager = LoggerManager("test", config)
+            self.assertIsInstance(logger_manager.logger.handlers[0], logging.handlers.QueueHandler)
+            try:
+                raise ValueError("Async failure")
+            except ValueError:
+                logger_manager.logger.exception("async_message %s", "arg")
+            logger_manager.set_level("DEBUG")
+            self.assertEqual(logger_manager._listener.handlers[0].level, logging.DEBUG)
+            logger_manager.close()
+            with open(temp_file) as f:
+                log_data = json.loads(f.readline())
+            self.assertEqual(log_data["message"], "async_message arg")
+            self.assertIn("ValueError", log_data["exception"])
+            self.assertEqual(logger_manager.logger.handlers, [])
+
+    def test_async_flush_drains_queue(self):
+        """
+        Test flushing an async logger.
+
+        @brief Test that flush() writes every record still waiting in the queue.
+        """
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_file = os.path.join(temp_dir, "test.log")
+            config = {"file": temp_file, "console": False, "async": True}
+            logger_manager = LoggerManager("test", config)
+            for i in range(2000):
+                logger_manager.logger.info("rec %d", i)
+            logger_manager.flush()
+            with open(temp_file) as f:
+                self.assertEqual(len(f.readlines()), 2000)
+            logger_manager.close()
+
+    def test_async_exit_drains_queue(self):
+        """
+        Test the interpreter exit hook for async loggers.
+
+        @brief Test that the exit hook writes queued records and stops the listener.
+        """
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_file = os.path.join(temp_dir, "test.log")
+            config = {"file": temp_file, "console": False, "async": True}
+            thread_count = threading.active_count()
+            logger_manager = LoggerManager("test", config)
+            for i in range(2000):
+                logger_manager.logger.info("rec %d", i)
+            _stop_listeners()
+            self.assertEqual(threading.active_count(), thread_count)
+            with open(temp_file) as f:
+                self.assertEqual(len(f.readlines()), 2000)
+            logger_manager.close()
+
+    def test_async_reinit_stops_listener(self):
+        """
+        Test re-creating an async logger under the same name.
+
+        @brief Test that the earlier listener thread is stopped and its records written.
+        """
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_file = os.path.join(temp_dir, "test.log")
+            config = {"file": temp_file, "console": False, "async": True}
+            thread_count = threading.active_count()
+            first = LoggerManager("test", config)
+            first.logger.info("first_message")
+            second = LoggerManager("test", config)
+            self.assertEqual(threading.active_count(), thread_count + 1)
+            with open(temp_file) as f:
+                self.assertIn("first_message", f.read())
+            # The replaced manager treats its listener as already stopped
+            first.flush()
+            first.close()
+            self.assertEqual(threading.active_count(), thread_count + 1)
+            second.close()
+            self.assertEqual(threading.active_count(), thread_count)
 
 
 class TestJSONFormatter(unittest.TestCase):
@@ -292,6 +401,22 @@ class TestJSONFormatter(unittest.TestCase):
         self.assertEqual(log_data["message"], "Test message")
         self.assertEqual(log_data["logger"], "test")
 
+    def test_format_extra_fields(self):
+        """
+        Test JSON formatting of extra record attributes.
+
+        @brief Test that extra attributes are included while reserved ones are not.
+        """
+        formatter = JSONFormatter()
+        record = logging.LogRecord(level=logging.INFO, **_RECORD_KWARGS)
+        record.request_id = "abc123"
+
+        log_data = json.loads(formatter.format(record))
+
+        self.assertEqual(log_data["request_id"], "abc123")
+        self.assertNotIn("msg", log_data)
+        self.assertNotIn("levelno", log_data)
+
     def test_format_with_exception(self):
         """
         Test JSON formatting with exception information.
@@ -303,8 +428,6 @@ class TestJSONFormatter(unittest.TestCase):
         try:
             raise ValueError("Test exception")
         except ValueError:
-            import sys
-
             exc_info = sys.exc_info()
             record = logging.LogRecord(
                 name="test",
@@ -322,21 +445,75 @@ class TestJSONFormatter(unittest.TestCase):
             self.assertIn("exception", log_data)
             self.assertIn("ValueError", log_data["exception"])
 
+    def test_format_without_orjson(self):
+        """
+        Test JSON formatting falls back to the standard json module.
 
-class TestColoredFormatter(unittest.TestCase):
-    """
-    Test cases for ColoredFormatter class.
+        @brief Test that JSONFormatter works when orjson is not installed.
+        """
+        formatter = JSONFormatter()
+        record = logging.LogRecord(
+            name="test",
+            level=logging.INFO,
+            pathname="test.py",
+            lineno=1,
+            msg="Test message",
+            args=(),
+            exc_info=None,
+        )
 
-    @brief Test suite for colored formatter functionality.
-    """
+        with patch("commonpython.logging.logger_manager.HAS_ORJSON", False):
+            formatted = formatter.format(record)
 
-    def test_format_with_colors(self):
+        self.assertEqual(json.loads(formatted)["message"], "Test message")
+
+    @unittest.skipUnless(HAS_ORJSON, "orjson not installed")
+    def test_format_orjson_matches_json(self):
         """
-        Test colored formatting.
+        Test that orjson and json produce the same log entry.
 
-        @brief Test that ColoredFormatter adds color codes correctly.
+        @brief Test extra fields that orjson would otherwise render differently.
+        """
+
+        class Color(enum.Enum):
+            RED = "red"
+
+        @dataclasses.dataclass
+        class Point:
+            x: int = 1
+
+        Pair = collections.namedtuple("Pair", "a b")
+
+        extras = {
+            "when": datetime(2024, 1, 2, 3, 4, 5),
+            "color": Color.RED,
+            "point": Point(),
+            "pair": Pair(1, 2),
+            "ratio": float("nan"),
+            "nested": {"colors": [Color.RED], "when": datetime(2024, 1, 2)},
+        }
+        formatter = JSONFormatter()
+        for key, value in extras.items():
+            with self.subTest(key=key):
+                record = logging.LogRecord(level=logging.INFO, **_RECORD_KWARGS)
+                setattr(record, key, value)
+                fast = formatter.format(record)
+                with patch("commonpython.logging.logger_manager.HAS_ORJSON", False):
+                    slow = formatter.format(record)
+                # Re-dump so NaN compares equal and whitespace differences drop out
+                self.assertEqual(
+                    json.dumps(json.loads(fast), sort_keys=True),
+                    json.dumps(json.loads(slow), sort_keys=True),
+                )
+
+    @unittest.skipUnless(HAS_ORJSON, "orjson not installed")
+    def test_format_orjson_unsupported_value(self):
+        """
+        Test JSON formatting of values orjson cannot encode.
+
+        @brief Test that JSONFormatter falls back to json for integers beyond 64 bits.
         """
-        formatter = ColoredFormatter("%(levelname)s - %(message)s")
+        formatter = JSONFormatter()
         record = logging.LogRecord(
             name="test",
             level=logging.INFO,
@@ -346,6 +523,28 @@ class TestColoredFormatter(unittest.TestCase):
             args=(),
             exc_info=None,
         )
+        record.big_number = 2**70
+
+        formatted = formatter.format(record)
+
+        self.assertEqual(json.loads(formatted)["big_number"], 2**70)
+
+
+class TestColoredFormatter(unittest.TestCase):
+    """
+    Test cases for ColoredFormatter class.
+
+    @brief Test suite for colored formatter functionality.
+    """
+
+    def test_format_with_colors(self):
+        """
+        Test colored formatting.
+
+        @brief Test that ColoredFormatter adds color codes correctly.
+        """
+        formatter = ColoredFormatter("%(levelname)s - %(message)s", force_color=True)
+        record = logging.LogRecord(level=logging.INFO, **_RECORD_KWARGS)
 
         formatted = formatter.format(record)
 
@@ -359,7 +558,7 @@ class TestColoredFormatter(unittest.TestCase):
 
         @brief Test that different log levels get different colors.
         """
-        formatter = ColoredFormatter("%(levelname)s - %(message)s")
+        formatter = ColoredFormatter("%(levelname)s - %(message)s", force_color=True)
 
         levels = [
             (logging.DEBUG, "\033[36m"),  # Cyan
@@ -370,15 +569,45 @@ class TestColoredFormatter(unittest.TestCase):
         ]
 
         for level, expected_color in levels:
-            record = logging.LogRecord(
-                name="test",
-                level=level,
-                pathname="test.py",
-                lineno=1,
-                msg="Test message",
-                args=(),
-                exc_info=None,
-            )
+            with self.subTest(level=logging.getLevelName(level)):
+                record = logging.LogRecord(level=level, **_RECORD_KWARGS)
+                formatted = formatter.format(record)
+                self.assertIn(expected_color, formatted)
 
-            formatted = formatter.format(record)
-            self.assertIn(expected_color, formatted)
+    def test_format_default_format(self):
+        """
+        Test formatting with the default format.
+
+        @brief Test that the default format colors the level name.
+        """
+        formatter = ColoredFormatter(DEFAULT_FORMAT, force_color=True)
+
+        record = logging.LogRecord(level=logging.INFO, **_RECORD_KWARGS)
+        formatted = formatter.format(record)
+        self.assertIn("\033[32mINFO\033[0m - Test message", formatted)
+
+    def test_format_without_tty(self):
+        """
+        Test formatting when stdout is not a terminal.
+
+        @brief Test that colors are omitted off a TTY unless forced.
+        """
+        record = logging.LogRecord(level=logging.INFO, **_RECORD_KWARGS)
+        with patch("commonpython.logging.logger_manager._IS_TTY", False):
+            plain = ColoredFormatter("%(levelname)s - %(message)s")
+            forced = ColoredFormatter("%(levelname)s - %(message)s", force_color=True)
+
+        self.assertEqual(plain.format(record), "INFO - Test message")
+        self.assertIn("\033[32m", forced.format(record))
+
+    def test_format_custom_level(self):
+        """
+        Test formatting a level without an assigned color.
+
+        @brief Test that custom log levels are left uncolored.
+        """
+        formatter = ColoredFormatter("%(levelname)s - %(message)s", force_color=True)
+        record = logging.LogRecord(level=25, **_RECORD_KWARGS)
+
+        formatted = formatter.format(record)
+        self.assertEqual(formatted, "Level 25 - Test message")
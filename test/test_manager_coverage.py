@@ -5,11 +5,11 @@ Focus on increasing coverage to 95%+ by testing edge cases,
 error paths, and specific parameter combinations.
 """
 
-import os
+import copy
 import sys
 import unittest
 from pathlib import Path
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, patch
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -21,9 +21,10 @@ from commonpython.messaging.mq_manager import MQManager  # noqa: E402
 class TestDB2ManagerComprehensive(unittest.TestCase):
     """Comprehensive tests for DB2Manager to reach 95%+ coverage"""
 
-    def setUp(self):
-        """Set up test fixtures"""
-        self.config = {
+    @classmethod
+    def setUpClass(cls):
+        """Build a connected manager shared by the tests"""
+        cls.config = {
             "host": "localhost",
             "port": 50000,
             "name": "testdb",
@@ -31,146 +32,105 @@ class TestDB2ManagerComprehensive(unittest.TestCase):
             "password": "testpass",
             "schema": "testschema",
         }
-        self.logger = Mock()
-        self.logger.logger = Mock()
+        cls.logger = Mock()
+        cls.logger.logger = Mock()
+        with patch("commonpython.database.db2_manager.subprocess.run") as mock_run:
+            mock_run.return_value = Mock(returncode=0, stdout="Connected", stderr="")
+            cls._connected_manager = DB2Manager(cls.config, cls.logger)
+            cls._connected_manager.connect()
 
-    @patch("commonpython.database.db2_manager.subprocess.run")
-    def test_connect_with_schema(self, mock_run):
-        """Test connect with schema configuration"""
-        mock_run.return_value = Mock(returncode=0, stdout="Connected", stderr="")
+    def setUp(self):
+        """Set up test fixtures"""
+        self.run_patcher = patch("commonpython.database.db2_manager.subprocess.run")
+        self.mock_run = self.run_patcher.start()
+        self.mock_run.return_value = Mock(returncode=0, stdout="Connected", stderr="")
+        self.manager = copy.copy(self._connected_manager)
 
+    def tearDown(self):
+        """Stop subprocess patching"""
+        self.run_patcher.stop()
+
+    def test_connect_with_schema(self):
+        """Test connect with schema configuration"""
         manager = DB2Manager(self.config, self.logger)
         result = manager.connect()
 
         self.assertTrue(result)
         # Verify schema was set
-        call_args = mock_run.call_args_list
+        call_args = self.mock_run.call_args_list
         self.assertTrue(len(call_args) > 0)
 
-    @patch("commonpython.database.db2_manager.subprocess.run")
-    def test_execute_query_parse_error(self, mock_run):
+    def test_execute_query_parse_error(self):
         """Test execute_query with parse error"""
-        mock_run.return_value = Mock(returncode=0, stdout="Connected", stderr="")
-
-        manager = DB2Manager(self.config, self.logger)
-        manager.connect()
-
         # Test with invalid CSV output
-        mock_run.return_value = Mock(returncode=0, stdout="Invalid\nData", stderr="")
-        results = manager.execute_query("SELECT * FROM test")
+        self.mock_run.return_value = Mock(returncode=0, stdout="Invalid\nData", stderr="")
+        results = self.manager.execute_query("SELECT * FROM test")
         self.assertIsInstance(results, list)
 
-    @patch("commonpython.database.db2_manager.subprocess.run")
-    def test_execute_query_error_code(self, mock_run):
+    def test_execute_query_error_code(self):
         """Test execute_query with error returncode"""
-        mock_run.return_value = Mock(returncode=0, stdout="Connected", stderr="")
-
-        manager = DB2Manager(self.config, self.logger)
-        manager.connect()
-
         # Test with error returncode - should raise exception
-        mock_run.return_value = Mock(returncode=1, stdout="", stderr="SQL Error")
+        self.mock_run.return_value = Mock(returncode=1, stdout="", stderr="SQL Error")
         with self.assertRaises(Exception):
-            manager.execute_query("SELECT * FROM nonexistent")
+            self.manager.execute_query("SELECT * FROM nonexistent")
 
-    @patch("commonpython.database.db2_manager.subprocess.run")
-    def test_execute_update_with_error(self, mock_run):
+    def test_execute_update_with_error(self):
         """Test execute_update with subprocess error"""
-        mock_run.return_value = Mock(returncode=0, stdout="Connected", stderr="")
-
-        manager = DB2Manager(self.config, self.logger)
-        manager.connect()
-
         # Test with error returncode
-        mock_run.return_value = Mock(returncode=1, stdout="", stderr="Update Error")
-        rows = manager.execute_update("UPDATE nonexistent SET x=1")
+        self.mock_run.return_value = Mock(returncode=1, stdout="", stderr="Update Error")
+        rows = self.manager.execute_update("UPDATE nonexistent SET x=1")
         # When there's an error, it returns affected rows from parsing
         self.assertIsInstance(rows, int)
 
-    @patch("commonpython.database.db2_manager.subprocess.run")
-    def test_execute_batch_empty(self, mock_run):
+    def test_execute_batch_empty(self):
         """Test execute_batch with empty queries"""
-        mock_run.return_value = Mock(returncode=0, stdout="Connected", stderr="")
-
-        manager = DB2Manager(self.config, self.logger)
-        manager.connect()
-
-        results = manager.execute_batch([])
+        results = self.manager.execute_batch([])
         self.assertEqual(results, [])
 
-    @patch("commonpython.database.db2_manager.subprocess.run")
-    def test_execute_batch_with_none_params(self, mock_run):
+    def test_execute_batch_with_none_params(self):
         """Test execute_batch with None params_list"""
-        mock_run.return_value = Mock(returncode=0, stdout="Connected", stderr="")
-
-        manager = DB2Manager(self.config, self.logger)
-        manager.connect()
-
-        mock_run.return_value = Mock(returncode=0, stdout="1 row affected", stderr="")
-        results = manager.execute_batch(["UPDATE test SET x=1"], None)
+        self.mock_run.return_value = Mock(returncode=0, stdout="1 row affected", stderr="")
+        results = self.manager.execute_batch(["UPDATE test SET x=1"], None)
         self.assertIsInstance(results, list)
 
-    @patch("commonpython.database.db2_manager.subprocess.run")
-    def test_transaction_commit_success(self, mock_run):
+    def test_transaction_commit_success(self):
         """Test transaction commits on success"""
-        mock_run.return_value = Mock(returncode=0, stdout="Connected", stderr="")
-
-        manager = DB2Manager(self.config, self.logger)
-        manager.connect()
-
         # Transaction should commit successfully
-        with manager.transaction():
+        with self.manager.transaction():
             pass  # No exception
 
         # Transaction context manager handles commit internally
         self.assertTrue(True)
 
-    @patch("commonpython.database.db2_manager.subprocess.run")
-    def test_get_table_info_error(self, mock_run):
+    def test_get_table_info_error(self):
         """Test get_table_info with error"""
-        mock_run.return_value = Mock(returncode=0, stdout="Connected", stderr="")
-
-        manager = DB2Manager(self.config, self.logger)
-        manager.connect()
-
-        mock_run.return_value = Mock(returncode=1, stdout="", stderr="Table not found")
+        self.mock_run.return_value = Mock(returncode=1, stdout="", stderr="Table not found")
         # get_table_info raises Exception on error
         with self.assertRaises(Exception):
-            manager.get_table_info("nonexistent_table")
+            self.manager.get_table_info("nonexistent_table")
 
-    @patch("commonpython.database.db2_manager.subprocess.run")
-    def test_get_database_info_error(self, mock_run):
+    def test_get_database_info_error(self):
         """Test get_database_info with error"""
-        mock_run.return_value = Mock(returncode=0, stdout="Connected", stderr="")
-
-        manager = DB2Manager(self.config, self.logger)
-        manager.connect()
-
-        mock_run.return_value = Mock(returncode=1, stdout="", stderr="Database info error")
+        self.mock_run.return_value = Mock(returncode=1, stdout="", stderr="Database info error")
         # get_database_info raises Exception on error
         with self.assertRaises(Exception):
-            manager.get_database_info()
+            self.manager.get_database_info()
 
-    @patch("commonpython.database.db2_manager.subprocess.run")
-    def test_test_connection_failure(self, mock_run):
+    def test_test_connection_failure(self):
         """Test test_connection when connection fails"""
-        mock_run.return_value = Mock(returncode=0, stdout="Connected", stderr="")
-
-        manager = DB2Manager(self.config, self.logger)
-        manager.connect()
-
         # Mock connect to return False
-        with patch.object(manager, "connect", return_value=False):
-            result = manager.test_connection()
+        with patch.object(self.manager, "connect", return_value=False):
+            result = self.manager.test_connection()
             self.assertFalse(result)
 
 
 class TestMQManagerComprehensive(unittest.TestCase):
     """Comprehensive tests for MQManager to reach 95%+ coverage"""
 
-    def setUp(self):
-        """Set up test fixtures"""
-        self.config = {
+    @classmethod
+    def setUpClass(cls):
+        """Build a connected manager shared by the tests"""
+        cls.config = {
             "host": "localhost",
             "port": 1414,
             "queue_manager": "QM1",
@@ -178,126 +138,85 @@ class TestMQManagerComprehensive(unittest.TestCase):
             "user": "mquser",
             "password": "mqpass",
         }
-        self.logger = Mock()
-        self.logger.logger = Mock()
+        cls.logger = Mock()
+        cls.logger.logger = Mock()
+        with patch("commonpython.messaging.mq_manager.subprocess.run") as mock_run:
+            mock_run.return_value = Mock(returncode=0, stdout="Connected", stderr="")
+            cls._connected_manager = MQManager(cls.config, cls.logger)
+            cls._connected_manager.connect()
 
-    @patch("commonpython.messaging.mq_manager.subprocess.run")
-    def test_connect_with_user_password(self, mock_run):
-        """Test connect with user and password"""
-        mock_run.return_value = Mock(returncode=0, stdout="Connected", stderr="")
+    def setUp(self):
+        """Set up test fixtures"""
+        self.run_patcher = patch("commonpython.messaging.mq_manager.subprocess.run")
+        self.mock_run = self.run_patcher.start()
+        self.mock_run.return_value = Mock(returncode=0, stdout="Connected", stderr="")
+        self.manager = copy.copy(self._connected_manager)
 
+    def tearDown(self):
+        """Stop subprocess patching"""
+        self.run_patcher.stop()
+
+    def test_connect_with_user_password(self):
+        """Test connect with user and password"""
         manager = MQManager(self.config, self.logger)
         result = manager.connect()
 
         self.assertTrue(result)
 
-    @patch("commonpython.messaging.mq_manager.subprocess.run")
-    def test_put_message_dict(self, mock_run):
+    def test_put_message_dict(self):
         """Test put_message with dictionary"""
-        mock_run.return_value = Mock(returncode=0, stdout="Connected", stderr="")
-
-        manager = MQManager(self.config, self.logger)
-        manager.connect()
-
-        mock_run.return_value = Mock(returncode=0, stdout="Message sent", stderr="")
-        result = manager.put_message("TEST.QUEUE", {"key": "value"})
+        self.mock_run.return_value = Mock(returncode=0, stdout="Message sent", stderr="")
+        result = self.manager.put_message("TEST.QUEUE", {"key": "value"})
         self.assertTrue(result)
 
-    @patch("commonpython.messaging.mq_manager.subprocess.run")
-    def test_put_message_bytes(self, mock_run):
+    def test_put_message_bytes(self):
         """Test put_message with bytes"""
-        mock_run.return_value = Mock(returncode=0, stdout="Connected", stderr="")
-
-        manager = MQManager(self.config, self.logger)
-        manager.connect()
-
-        mock_run.return_value = Mock(returncode=0, stdout="Message sent", stderr="")
-        result = manager.put_message("TEST.QUEUE", b"binary data")
+        self.mock_run.return_value = Mock(returncode=0, stdout="Message sent", stderr="")
+        result = self.manager.put_message("TEST.QUEUE", b"binary data")
         self.assertTrue(result)
 
-    @patch("commonpython.messaging.mq_manager.subprocess.run")
-    def test_put_message_error(self, mock_run):
+    def test_put_message_error(self):
         """Test put_message with error"""
-        mock_run.return_value = Mock(returncode=0, stdout="Connected", stderr="")
-
-        manager = MQManager(self.config, self.logger)
-        manager.connect()
-
-        mock_run.return_value = Mock(returncode=1, stdout="", stderr="Queue not found")
-        result = manager.put_message("NONEXISTENT.QUEUE", "message")
+        self.mock_run.return_value = Mock(returncode=1, stdout="", stderr="Queue not found")
+        result = self.manager.put_message("NONEXISTENT.QUEUE", "message")
         self.assertFalse(result)
 
-    @patch("commonpython.messaging.mq_manager.subprocess.run")
-    def test_get_message_empty_queue(self, mock_run):
+    def test_get_message_empty_queue(self):
         """Test get_message from empty queue"""
-        mock_run.return_value = Mock(returncode=0, stdout="Connected", stderr="")
-
-        manager = MQManager(self.config, self.logger)
-        manager.connect()
-
-        mock_run.return_value = Mock(returncode=1, stdout="", stderr="No messages")
-        message = manager.get_message("EMPTY.QUEUE")
+        self.mock_run.return_value = Mock(returncode=1, stdout="", stderr="No messages")
+        message = self.manager.get_message("EMPTY.QUEUE")
         self.assertIsNone(message)
 
-    @patch("commonpython.messaging.mq_manager.subprocess.run")
-    def test_browse_message_error(self, mock_run):
+    def test_browse_message_error(self):
         """Test browse_message with error"""
-        mock_run.return_value = Mock(returncode=0, stdout="Connected", stderr="")
-
-        manager = MQManager(self.config, self.logger)
-        manager.connect()
-
-        mock_run.return_value = Mock(returncode=1, stdout="", stderr="Browse error")
-        message = manager.browse_message("TEST.QUEUE")
+        self.mock_run.return_value = Mock(returncode=1, stdout="", stderr="Browse error")
+        message = self.manager.browse_message("TEST.QUEUE")
         self.assertIsNone(message)
 
-    @patch("commonpython.messaging.mq_manager.subprocess.run")
-    def test_get_queue_depth_error(self, mock_run):
+    def test_get_queue_depth_error(self):
         """Test get_queue_depth with error"""
-        mock_run.return_value = Mock(returncode=0, stdout="Connected", stderr="")
-
-        manager = MQManager(self.config, self.logger)
-        manager.connect()
-
-        mock_run.return_value = Mock(returncode=1, stdout="", stderr="Queue depth error")
-        depth = manager.get_queue_depth("TEST.QUEUE")
+        self.mock_run.return_value = Mock(returncode=1, stdout="", stderr="Queue depth error")
+        depth = self.manager.get_queue_depth("TEST.QUEUE")
         self.assertEqual(depth, -1)
 
-    @patch("commonpython.messaging.mq_manager.subprocess.run")
-    def test_get_queue_depth_parse_error(self, mock_run):
+    def test_get_queue_depth_parse_error(self):
         """Test get_queue_depth with parse error"""
-        mock_run.return_value = Mock(returncode=0, stdout="Connected", stderr="")
-
-        manager = MQManager(self.config, self.logger)
-        manager.connect()
-
-        mock_run.return_value = Mock(returncode=0, stdout="Invalid depth", stderr="")
-        depth = manager.get_queue_depth("TEST.QUEUE")
+        self.mock_run.return_value = Mock(returncode=0, stdout="Invalid depth", stderr="")
+        depth = self.manager.get_queue_depth("TEST.QUEUE")
         # Parse error typically returns 0 or a default value
         self.assertIsInstance(depth, int)
 
-    @patch("commonpython.messaging.mq_manager.subprocess.run")
-    def test_purge_queue_error(self, mock_run):
+    def test_purge_queue_error(self):
         """Test purge_queue with error"""
-        mock_run.return_value = Mock(returncode=0, stdout="Connected", stderr="")
-
-        manager = MQManager(self.config, self.logger)
-        manager.connect()
-
-        mock_run.return_value = Mock(returncode=1, stdout="", stderr="Purge error")
+        self.mock_run.return_value = Mock(returncode=1, stdout="", stderr="Purge error")
         # purge_queue raises Exception on error
         with self.assertRaises(Exception):
-            manager.purge_queue("TEST.QUEUE")
+            self.manager.purge_queue("TEST.QUEUE")
 
-    @patch("commonpython.messaging.mq_manager.subprocess.run")
-    def test_test_connection_success(self, mock_run):
+    def test_test_connection_success(self):
         """Test test_connection when connection succeeds"""
-        mock_run.return_value = Mock(returncode=0, stdout="Connected", stderr="")
-
-        manager = MQManager(self.config, self.logger)
-
         # test_connection will call connect internally
-        result = manager.test_connection()
+        result = self.manager.test_connection()
         self.assertTrue(result)
 
 
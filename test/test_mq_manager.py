@@ -4,16 +4,118 @@ Test cases for MQManager
 Tests messaging functionality using CLI interface with mocked subprocess calls.
 """
 
+import json
+import re
+import subprocess
 import sys
 import unittest
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import Mock, patch
 
 # Add the parent directory to the path to import the module
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+import commonpython.messaging.mq_manager as mq_manager_module  # noqa: E402
 from commonpython.messaging.mq_manager import MQManager  # noqa: E402
 
+# Canned subprocess.run results; MQManager only reads returncode, stdout and stderr
+_OK = SimpleNamespace(returncode=0, stdout="Success", stderr="")
+_FAIL = SimpleNamespace(returncode=1, stdout="", stderr="Command failed")
+_QMGR_OK = SimpleNamespace(returncode=0, stdout="QMGR display successful", stderr="")
+_CONNECT_FAIL = SimpleNamespace(returncode=1, stdout="", stderr="Connection failed")
+_SENT = SimpleNamespace(returncode=0, stdout="Message sent", stderr="")
+_SEND_FAIL = SimpleNamespace(returncode=1, stdout="", stderr="Send failed")
+_JSON_MESSAGE = SimpleNamespace(returncode=0, stdout='{"message": "test data"}', stderr="")
+_PLAIN_MESSAGE = SimpleNamespace(returncode=0, stdout="plain text message", stderr="")
+_NO_MESSAGE = SimpleNamespace(returncode=0, stdout="", stderr="")
+_TEST_MESSAGE = SimpleNamespace(returncode=0, stdout="test message", stderr="")
+_INVALID_JSON = SimpleNamespace(returncode=0, stdout="{invalid_json}", stderr="")
+_DEPTH_5 = SimpleNamespace(returncode=0, stdout="CURDEPTH 5", stderr="")
+_DEPTH_0 = SimpleNamespace(returncode=0, stdout="CURDEPTH 0", stderr="")
+_DEPTH_INVALID = SimpleNamespace(returncode=0, stdout="CURDEPTH notanumber", stderr="")
+_QUEUE_NOT_FOUND = SimpleNamespace(returncode=1, stdout="", stderr="Queue not found")
+_UNEXPECTED_OUTPUT = SimpleNamespace(returncode=0, stdout="SOMETHING ELSE", stderr="")
+_CLEARED = SimpleNamespace(returncode=0, stdout="Queue cleared", stderr="")
+_PURGE_FAIL = SimpleNamespace(returncode=1, stdout="", stderr="Purge failed")
+
+# Message handed back by a stubbed get_message() in the browse tests
+_BROWSED = MappingProxyType(
+    {
+        "data": "test message",
+        "properties": {"message_id": "msg123"},
+        "raw_bytes": b"test message",
+    }
+)
+
+# Dictionary payload and the JSON text put_message hands to amqsput for it
+_MSG_DICT = MappingProxyType({"key": "value", "number": 123})
+_MSG_DICT_JSON = json.dumps(dict(_MSG_DICT))
+
+# Raised by every queue operation attempted before connect()
+_NOT_CONNECTED = re.compile("connection not established")
+
+
+def _raise(exc):
+    """
+    Build a stand-in callable that always raises.
+
+    @param exc Exception instance to raise
+    @return Function accepting any arguments and raising exc
+    """
+
+    def fail(*args, **kwargs):
+        raise exc
+
+    return fail
+
+
+class _Spy:
+    """
+    Callable that only counts how often it is called.
+
+    @brief Stand-in for a Mock where a test needs no call arguments.
+    """
+
+    __slots__ = ("calls",)
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, *args, **kwargs):
+        self.calls += 1
+
+
+class _FakeLogger:
+    """
+    Stand-in for LoggerManager exposing the methods MQManager calls.
+
+    @brief Logger stub whose methods are call-counting spies.
+    """
+
+    def __init__(self):
+        self.logger = SimpleNamespace(info=_Spy(), error=_Spy())
+        self.log_mq_operation = _Spy()
+
+
+class _FakeMessageFile:
+    """
+    Stand-in for the NamedTemporaryFile put_message writes its payload to.
+
+    @brief Context manager with a fixed name that discards writes.
+    """
+
+    name = "/tmp/test.msg"
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def write(self, data):
+        return len(data)
+
 
 class TestMQManager(unittest.TestCase):
     """
@@ -22,22 +124,124 @@ class TestMQManager(unittest.TestCase):
     @brief Comprehensive test suite for messaging functionality using CLI interface.
     """
 
+    # (method name, positional args, subprocess.run result, expected return value)
+    CLI_CASES = [
+        ("get_queue_depth", ("TEST.QUEUE",), _DEPTH_5, 5),
+        ("get_queue_depth", ("TEST.QUEUE",), _DEPTH_0, 0),
+        ("get_queue_depth", ("TEST.QUEUE",), _QUEUE_NOT_FOUND, -1),
+        ("get_queue_depth", ("TEST.QUEUE",), _UNEXPECTED_OUTPUT, 0),
+        ("get_queue_depth", ("TEST.QUEUE",), _DEPTH_INVALID, 0),
+        ("get_message", ("TEST.QUEUE",), _NO_MESSAGE, None),
+        ("test_connection", (), _QMGR_OK, True),
+        ("test_connection", (), _CONNECT_FAIL, False),
+    ]
+
+    # (case name, message, properties, subprocess.run result or raised exception, expected result)
+    PUT_CASES = [
+        ("text", "test message", None, _SENT, True),
+        ("failure", "test message", None, _SEND_FAIL, False),
+        ("dict", dict(_MSG_DICT), None, _SENT, True),
+        ("bytes", b"binary message", None, _SENT, True),
+        ("properties", "test message", {"priority": 5}, _SENT, True),
+        ("exception", "test message", None, Exception("Send error"), False),
+    ]
+
+    # (case name, subprocess.run result, get_message timeout, expected decoded data)
+    GET_CASES = [
+        ("json", _JSON_MESSAGE, None, {"message": "test data"}),
+        ("plain_text", _PLAIN_MESSAGE, None, "plain text message"),
+        ("invalid_json", _INVALID_JSON, None, "{invalid_json}"),
+        ("timeout", _TEST_MESSAGE, 10, "test message"),
+    ]
+
+    # Operations that must refuse to run without an established connection
+    CONNECTED_OPERATIONS = [
+        ("put_message", ("TEST.QUEUE", "test message")),
+        ("get_message", ("TEST.QUEUE",)),
+        ("browse_message", ("TEST.QUEUE",)),
+        ("get_queue_depth", ("TEST.QUEUE",)),
+        ("purge_queue", ("TEST.QUEUE",)),
+    ]
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Set up shared test fixtures.
+
+        @brief Build one MQManager and the subprocess and temp file patches reused by every test.
+        """
+        # Read-only so no test can leak config changes through the shared manager
+        cls.config = MappingProxyType(
+            {
+                "host": "localhost",
+                "port": 1414,
+                "queue_manager": "TEST_QM",
+                "channel": "TEST.CHANNEL",
+                "user": "testuser",
+                "password": "testpass",
+                "timeout": 30,
+            }
+        )
+        cls.mq_manager = MQManager(cls.config)
+        cls.mock_run = Mock()
+        cls.mock_unlink = Mock()
+        # put_message writes the payload to a temporary file before calling amqsput
+        message_file = _FakeMessageFile()
+        # Swap the module's own references so the real os, tempfile and subprocess stay intact
+        cls._patch_module(
+            "subprocess",
+            SimpleNamespace(run=cls.mock_run, TimeoutExpired=subprocess.TimeoutExpired),
+        )
+        cls._patch_module(
+            "tempfile", SimpleNamespace(NamedTemporaryFile=lambda *args, **kwargs: message_file)
+        )
+        cls._patch_module("os", SimpleNamespace(unlink=cls.mock_unlink))
+
+    @classmethod
+    def _patch_module(cls, name, new):
+        """
+        Replace a module-level name of mq_manager for the lifetime of the test class.
+
+        @param name Name of the module attribute to replace
+        @param new Object installed in place of the attribute
+        """
+        patcher = patch.object(mq_manager_module, name, new)
+        cls.addClassCleanup(patcher.stop)
+        patcher.start()
+
     def setUp(self):
         """
         Set up test fixtures.
 
-        @brief Initialize test environment before each test.
+        @brief Reset the shared manager and patched mocks between tests.
         """
-        self.config = {
-            "host": "localhost",
-            "port": 1414,
-            "queue_manager": "TEST_QM",
-            "channel": "TEST.CHANNEL",
-            "user": "testuser",
-            "password": "testpass",
-            "timeout": 30,
-        }
-        self.mq_manager = MQManager(self.config)
+        self.mq_manager.connected = False
+        self.mq_manager.logger = None
+        self.mock_run.reset_mock(return_value=True, side_effect=True)
+        self.mock_unlink.reset_mock()
+        self.fake_logger = _FakeLogger()
+
+    def _manager_with_logger(self, logger):
+        """
+        Attach a logger to the shared manager.
+
+        @param logger Logger instance or stub
+        @return The shared MQManager; setUp detaches the logger again
+        """
+        self.mq_manager.logger = logger
+        return self.mq_manager
+
+    def _swap(self, attr, value):
+        """
+        Shadow a method of the shared manager for the current test.
+
+        @param attr Attribute name to shadow on the instance
+        @param value Replacement, usually a Mock recorder
+        @return The replacement; the instance attribute is deleted on cleanup
+        """
+        setattr(self.mq_manager, attr, value)
+        self.addCleanup(delattr, self.mq_manager, attr)
+        return value
 
     def test_init(self):
         """
@@ -45,9 +249,11 @@ class TestMQManager(unittest.TestCase):
 
         @brief Test that MQManager initializes correctly with configuration.
         """
-        self.assertEqual(self.mq_manager.config, self.config)
-        self.assertIsNone(self.mq_manager.logger)
-        self.assertFalse(self.mq_manager.connected)
+        # setUp resets the shared manager, so build a fresh one to check __init__ itself
+        mq_manager = MQManager(self.config)
+        self.assertEqual(mq_manager.config, self.config)
+        self.assertIsNone(mq_manager.logger)
+        self.assertFalse(mq_manager.connected)
 
     def test_init_with_logger(self):
         """
@@ -55,9 +261,9 @@ class TestMQManager(unittest.TestCase):
 
         @brief Test MQManager initialization with logger instance.
         """
-        mock_logger = MagicMock()
-        mq_manager = MQManager(self.config, mock_logger)
-        self.assertEqual(mq_manager.logger, mock_logger)
+        logger = object()
+        mq_manager = MQManager(self.config, logger)
+        self.assertIs(mq_manager.logger, logger)
 
     def test_init_empty_config(self):
         """
@@ -114,18 +320,13 @@ class TestMQManager(unittest.TestCase):
         self.assertEqual(conn_info["password"], "")
         self.assertEqual(conn_info["timeout"], 30)
 
-    @patch("subprocess.run")
-    def test_execute_mq_command_success(self, mock_run):
+    def test_execute_mq_command_success(self):
         """
         Test successful MQ command execution.
 
         @brief Test that MQ commands execute successfully.
         """
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = "Success"
-        mock_result.stderr = ""
-        mock_run.return_value = mock_result
+        self.mock_run.return_value = _OK
 
         result = self.mq_manager._execute_mq_command("display", ["qmgr"])
 
@@ -133,18 +334,13 @@ class TestMQManager(unittest.TestCase):
         self.assertEqual(result["stdout"], "Success")
         self.assertEqual(result["returncode"], 0)
 
-    @patch("subprocess.run")
-    def test_execute_mq_command_failure(self, mock_run):
+    def test_execute_mq_command_failure(self):
         """
         Test failed MQ command execution.
 
         @brief Test that failed MQ commands are handled correctly.
         """
-        mock_result = MagicMock()
-        mock_result.returncode = 1
-        mock_result.stdout = ""
-        mock_result.stderr = "Command failed"
-        mock_run.return_value = mock_result
+        self.mock_run.return_value = _FAIL
 
         result = self.mq_manager._execute_mq_command("display", ["qmgr"])
 
@@ -152,158 +348,148 @@ class TestMQManager(unittest.TestCase):
         self.assertEqual(result["stderr"], "Command failed")
         self.assertEqual(result["returncode"], 1)
 
-    @patch("subprocess.run")
-    def test_execute_mq_command_with_no_params(self, mock_run):
+    def test_execute_mq_command_with_no_params(self):
         """
         Test MQ command execution without parameters.
         """
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = "Success"
-        mock_result.stderr = ""
-        mock_run.return_value = mock_result
+        self.mock_run.return_value = _OK
 
         result = self.mq_manager._execute_mq_command("display")
 
         self.assertTrue(result["success"])
 
-    @patch("subprocess.run")
-    def test_execute_mq_command_timeout(self, mock_run):
+    def test_execute_mq_command_timeout(self):
         """
         Test MQ command timeout.
 
         @brief Test that command timeouts are handled correctly.
         """
-        import subprocess
+        self.mock_run.side_effect = subprocess.TimeoutExpired("runmqsc", 30)
 
-        mock_run.side_effect = subprocess.TimeoutExpired("runmqsc", 30)
-
-        with self.assertRaises(Exception) as context:
+        with self.assertRaisesRegex(Exception, "timeout"):
             self.mq_manager._execute_mq_command("display", ["qmgr"])
 
-        self.assertIn("timeout", str(context.exception))
-
-    @patch("subprocess.run")
-    def test_execute_mq_command_general_exception(self, mock_run):
+    def test_execute_mq_command_general_exception(self):
         """
         Test MQ command general exception.
         """
-        mock_run.side_effect = Exception("General error")
+        self.mock_run.side_effect = Exception("General error")
 
-        with self.assertRaises(Exception) as context:
+        with self.assertRaisesRegex(Exception, "MQ command error"):
             self.mq_manager._execute_mq_command("display", ["qmgr"])
 
-        self.assertIn("MQ command error", str(context.exception))
-
-    @patch("subprocess.run")
-    def test_execute_mq_command_logger_error(self, mock_run):
+    def test_execute_mq_command_logger_error(self):
         """
         @brief Test _execute_mq_command with logger raising error.
         """
-        mq_manager = MQManager(self.config, MagicMock())
-        mq_manager.logger.logger.error = MagicMock(side_effect=Exception("Logger fail"))
+        error = Mock(side_effect=Exception("Logger fail"))
+        mq_manager = self._manager_with_logger(SimpleNamespace(logger=SimpleNamespace(error=error)))
 
-        with patch("subprocess.run", side_effect=Exception("subprocess error")):
-            with self.assertRaises(Exception):
-                mq_manager._execute_mq_command("display", ["qmgr"])
+        self.mock_run.side_effect = Exception("subprocess error")
 
-    @patch("subprocess.run")
-    def test_execute_mq_command_no_logger(self, mock_run):
+        with self.assertRaises(Exception):
+            mq_manager._execute_mq_command("display", ["qmgr"])
+        error.assert_called_once()
+
+    def test_execute_mq_command_no_logger(self):
         """
         @brief Test _execute_mq_command with no logger present.
         """
-        mq_manager = MQManager(self.config)
+        mq_manager = self.mq_manager
 
-        with patch("subprocess.run", side_effect=Exception("subprocess error")):
-            with self.assertRaises(Exception):
-                mq_manager._execute_mq_command("display", ["qmgr"])
+        self.mock_run.side_effect = Exception("subprocess error")
+
+        with self.assertRaises(Exception):
+            mq_manager._execute_mq_command("display", ["qmgr"])
 
-    @patch("subprocess.run")
-    def test_connect_success(self, mock_run):
+    def test_connect_success(self):
         """
         Test successful MQ connection.
 
         @brief Test that MQ connection succeeds.
         """
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = "QMGR display successful"
-        mock_result.stderr = ""
-        mock_run.return_value = mock_result
+        self.mock_run.return_value = _QMGR_OK
 
         result = self.mq_manager.connect()
 
         self.assertTrue(result)
         self.assertTrue(self.mq_manager.connected)
 
-    @patch("subprocess.run")
-    def test_connect_success_with_logger(self, mock_run):
+    def test_connect_success_with_logger(self):
         """
         Test successful connection with logger.
         """
-        mock_logger = MagicMock()
-        mq_manager = MQManager(self.config, mock_logger)
+        logger = self.fake_logger
+        mq_manager = self._manager_with_logger(logger)
 
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = "QMGR display successful"
-        mock_result.stderr = ""
-        mock_run.return_value = mock_result
+        self.mock_run.return_value = _QMGR_OK
 
         result = mq_manager.connect()
 
         self.assertTrue(result)
-        mock_logger.logger.info.assert_called()
+        self.assertTrue(logger.logger.info.calls)
 
-    @patch("subprocess.run")
-    def test_connect_failure(self, mock_run):
+    def test_connect_failure(self):
         """
         Test failed MQ connection.
 
         @brief Test that MQ connection failures are handled correctly.
         """
-        mock_result = MagicMock()
-        mock_result.returncode = 1
-        mock_result.stdout = ""
-        mock_result.stderr = "Connection failed"
-        mock_run.return_value = mock_result
+        self.mock_run.return_value = _CONNECT_FAIL
 
         result = self.mq_manager.connect()
 
         self.assertFalse(result)
         self.assertFalse(self.mq_manager.connected)
 
-    @patch("subprocess.run")
-    def test_connect_failure_with_logger(self, mock_run):
+    def test_connect_failure_with_logger(self):
         """
         Test failed connection with logger.
         """
-        mock_logger = MagicMock()
-        mq_manager = MQManager(self.config, mock_logger)
+        logger = self.fake_logger
+        mq_manager = self._manager_with_logger(logger)
 
-        mock_result = MagicMock()
-        mock_result.returncode = 1
-        mock_result.stdout = ""
-        mock_result.stderr = "Connection failed"
-        mock_run.return_value = mock_result
+        self.mock_run.return_value = _CONNECT_FAIL
 
         result = mq_manager.connect()
 
         self.assertFalse(result)
-        mock_logger.logger.error.assert_called()
+        self.assertTrue(logger.logger.error.calls)
 
-    @patch("subprocess.run")
-    def test_connect_exception(self, mock_run):
+    def test_connect_exception(self):
         """
         Test connection with exception.
         """
-        mock_run.side_effect = Exception("Connection error")
+        self.mock_run.side_effect = Exception("Connection error")
 
         result = self.mq_manager.connect()
 
         self.assertFalse(result)
         self.assertFalse(self.mq_manager.connected)
 
+    def test_cli_operations(self):
+        """
+        Test operations whose result follows directly from the CLI output.
+
+        @brief Test queue depth, empty get and connection checks against canned CLI results.
+        """
+        for name, args, result, expected in self.CLI_CASES:
+            with self.subTest(method=name, stdout=result.stdout, stderr=result.stderr):
+                self.mock_run.return_value = result
+                self.mq_manager.connected = True
+                self.assertEqual(getattr(self.mq_manager, name)(*args), expected)
+
+    def test_operations_not_connected(self):
+        """
+        Test operations when not connected.
+
+        @brief Test that queue operations fail when not connected to MQ.
+        """
+        for name, args in self.CONNECTED_OPERATIONS:
+            with self.subTest(method=name):
+                with self.assertRaisesRegex(Exception, _NOT_CONNECTED):
+                    getattr(self.mq_manager, name)(*args)
+
     def test_disconnect(self):
         """
         Test MQ disconnection.
@@ -318,27 +504,28 @@ class TestMQManager(unittest.TestCase):
         """
         Test disconnection with logger.
         """
-        mock_logger = MagicMock()
-        mq_manager = MQManager(self.config, mock_logger)
+        logger = self.fake_logger
+        mq_manager = self._manager_with_logger(logger)
         mq_manager.connected = True
 
         mq_manager.disconnect()
 
         self.assertFalse(mq_manager.connected)
-        mock_logger.logger.info.assert_called()
+        self.assertTrue(logger.logger.info.calls)
 
     def test_disconnect_exception(self):
         """
         Test disconnect handles exception gracefully.
         """
-        mock_logger = MagicMock()
-        mock_logger.logger.info.side_effect = Exception("Logger error")
-        mq_manager = MQManager(self.config, mock_logger)
+        logger = self.fake_logger
+        logger.logger.info = _raise(Exception("Logger error"))
+        mq_manager = self._manager_with_logger(logger)
         mq_manager.connected = True
 
         # Should not raise exception
         mq_manager.disconnect()
         self.assertFalse(mq_manager.connected)
+        self.assertEqual(logger.logger.error.calls, 1)
 
     def test_is_connected(self):
         """
@@ -351,358 +538,99 @@ class TestMQManager(unittest.TestCase):
         self.mq_manager.connected = True
         self.assertTrue(self.mq_manager.is_connected())
 
-    @patch("subprocess.run")
-    @patch("os.unlink")
-    @patch("tempfile.NamedTemporaryFile")
-    def test_put_message_success(self, mock_tempfile, mock_unlink, mock_run):
+    def test_put_message_cases(self):
         """
-        Test successful message sending.
+        Test message sending outcomes.
 
-        @brief Test that messages are sent successfully.
+        @brief Test payload conversion, properties, CLI failures and exceptions when sending.
         """
         self.mq_manager.connected = True
 
-        # Mock temporary file
-        mock_file = MagicMock()
-        mock_file.name = "/tmp/test.msg"
-        mock_file.__enter__ = MagicMock(return_value=mock_file)
-        mock_file.__exit__ = MagicMock(return_value=False)
-        mock_tempfile.return_value = mock_file
-
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = "Message sent"
-        mock_result.stderr = ""
-        mock_run.return_value = mock_result
+        for name, message, properties, outcome, expected in self.PUT_CASES:
+            with self.subTest(case=name):
+                self.mock_unlink.reset_mock()
+                # An iterable side effect returns results and raises exception instances
+                self.mock_run.side_effect = [outcome]
 
-        result = self.mq_manager.put_message("TEST.QUEUE", "test message")
+                result = self.mq_manager.put_message("TEST.QUEUE", message, properties)
 
-        self.assertTrue(result)
-        mock_unlink.assert_called_once()
+                self.assertIs(result, expected)
+                # The temporary message file is removed once amqsput has returned
+                if not isinstance(outcome, Exception):
+                    self.mock_unlink.assert_called_once()
 
-    @patch("subprocess.run")
-    @patch("os.unlink")
-    @patch("tempfile.NamedTemporaryFile")
-    def test_put_message_failure(self, mock_tempfile, mock_unlink, mock_run):
+    def test_put_message_dict_payload(self):
         """
-        Test failed message sending.
+        Test that dictionary messages are sent as JSON.
 
-        @brief Test that message sending failures are handled correctly.
+        @brief Test that amqsput receives the JSON encoding of a dict message.
         """
         self.mq_manager.connected = True
+        self.mock_run.return_value = _SENT
 
-        # Mock temporary file
-        mock_file = MagicMock()
-        mock_file.name = "/tmp/test.msg"
-        mock_file.__enter__ = MagicMock(return_value=mock_file)
-        mock_file.__exit__ = MagicMock(return_value=False)
-        mock_tempfile.return_value = mock_file
-
-        mock_result = MagicMock()
-        mock_result.returncode = 1
-        mock_result.stdout = ""
-        mock_result.stderr = "Send failed"
-        mock_run.return_value = mock_result
-
-        result = self.mq_manager.put_message("TEST.QUEUE", "test message")
-
-        self.assertFalse(result)
-
-    def test_put_message_not_connected(self):
-        """
-        Test message sending when not connected.
-
-        @brief Test that message sending fails when not connected to MQ.
-        """
-        with self.assertRaises(Exception) as context:
-            self.mq_manager.put_message("TEST.QUEUE", "test message")
-
-        self.assertIn("connection not established", str(context.exception))
+        self.assertTrue(self.mq_manager.put_message("TEST.QUEUE", dict(_MSG_DICT)))
+        self.assertEqual(self.mock_run.call_args.kwargs["input"], _MSG_DICT_JSON)
 
-    @patch("subprocess.run")
-    @patch("os.unlink")
-    @patch("tempfile.NamedTemporaryFile")
-    def test_put_message_dict(self, mock_tempfile, mock_unlink, mock_run):
-        """
-        Test sending dictionary message.
-
-        @brief Test that dictionary messages are converted to JSON.
-        """
-        self.mq_manager.connected = True
-
-        # Mock temporary file
-        mock_file = MagicMock()
-        mock_file.name = "/tmp/test.msg"
-        mock_file.__enter__ = MagicMock(return_value=mock_file)
-        mock_file.__exit__ = MagicMock(return_value=False)
-        mock_tempfile.return_value = mock_file
-
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = "Message sent"
-        mock_result.stderr = ""
-        mock_run.return_value = mock_result
-
-        message_dict = {"key": "value", "number": 123}
-        result = self.mq_manager.put_message("TEST.QUEUE", message_dict)
-
-        self.assertTrue(result)
-
-    @patch("subprocess.run")
-    @patch("os.unlink")
-    @patch("tempfile.NamedTemporaryFile")
-    def test_put_message_bytes(self, mock_tempfile, mock_unlink, mock_run):
-        """
-        Test sending bytes message.
-
-        @brief Test that bytes messages are handled correctly.
-        """
-        self.mq_manager.connected = True
-
-        # Mock temporary file
-        mock_file = MagicMock()
-        mock_file.name = "/tmp/test.msg"
-        mock_file.__enter__ = MagicMock(return_value=mock_file)
-        mock_file.__exit__ = MagicMock(return_value=False)
-        mock_tempfile.return_value = mock_file
-
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = "Message sent"
-        mock_result.stderr = ""
-        mock_run.return_value = mock_result
-
-        message_bytes = b"binary message"
-        result = self.mq_manager.put_message("TEST.QUEUE", message_bytes)
-
-        self.assertTrue(result)
-
-    @patch("subprocess.run")
-    @patch("os.unlink")
-    @patch("tempfile.NamedTemporaryFile")
-    def test_put_message_with_properties(self, mock_tempfile, mock_unlink, mock_run):
-        """
-        Test sending message with properties.
-        """
-        self.mq_manager.connected = True
-
-        # Mock temporary file
-        mock_file = MagicMock()
-        mock_file.name = "/tmp/test.msg"
-        mock_file.__enter__ = MagicMock(return_value=mock_file)
-        mock_file.__exit__ = MagicMock(return_value=False)
-        mock_tempfile.return_value = mock_file
-
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = "Message sent"
-        mock_result.stderr = ""
-        mock_run.return_value = mock_result
-
-        properties = {"priority": 5}
-        result = self.mq_manager.put_message("TEST.QUEUE", "test message", properties)
-
-        self.assertTrue(result)
-
-    @patch("subprocess.run")
-    @patch("os.unlink")
-    @patch("tempfile.NamedTemporaryFile")
-    def test_put_message_with_logger(self, mock_tempfile, mock_unlink, mock_run):
+    def test_put_message_with_logger(self):
         """
         Test put message with logger.
         """
-        mock_logger = MagicMock()
-        mq_manager = MQManager(self.config, mock_logger)
+        logger = self.fake_logger
+        mq_manager = self._manager_with_logger(logger)
         mq_manager.connected = True
-
-        # Mock temporary file
-        mock_file = MagicMock()
-        mock_file.name = "/tmp/test.msg"
-        mock_file.__enter__ = MagicMock(return_value=mock_file)
-        mock_file.__exit__ = MagicMock(return_value=False)
-        mock_tempfile.return_value = mock_file
-
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = "Message sent"
-        mock_result.stderr = ""
-        mock_run.return_value = mock_result
+        self.mock_run.return_value = _SENT
 
         result = mq_manager.put_message("TEST.QUEUE", "test message")
 
         self.assertTrue(result)
-        mock_logger.log_mq_operation.assert_called_once()
-
-    @patch("subprocess.run")
-    @patch("os.unlink")
-    @patch("tempfile.NamedTemporaryFile")
-    def test_put_message_exception(self, mock_tempfile, mock_unlink, mock_run):
-        """
-        Test put message with exception.
-        """
-        self.mq_manager.connected = True
-
-        # Mock temporary file
-        mock_file = MagicMock()
-        mock_file.name = "/tmp/test.msg"
-        mock_file.__enter__ = MagicMock(return_value=mock_file)
-        mock_file.__exit__ = MagicMock(return_value=False)
-        mock_tempfile.return_value = mock_file
-
-        mock_run.side_effect = Exception("Send error")
-
-        result = self.mq_manager.put_message("TEST.QUEUE", "test message")
-
-        self.assertFalse(result)
-
-    @patch("subprocess.run")
-    def test_get_message_success(self, mock_run):
-        """
-        Test successful message retrieval.
-
-        @brief Test that messages are retrieved successfully.
-        """
-        self.mq_manager.connected = True
+        self.assertEqual(logger.log_mq_operation.calls, 1)
 
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = '{"message": "test data"}'
-        mock_result.stderr = ""
-        mock_run.return_value = mock_result
-
-        result = self.mq_manager.get_message("TEST.QUEUE")
-
-        self.assertIsNotNone(result)
-        self.assertIn("data", result)
-        self.assertIn("properties", result)
-        self.assertIn("raw_bytes", result)
-
-    @patch("subprocess.run")
-    def test_get_message_plain_text(self, mock_run):
-        """
-        Test getting plain text message.
-        """
-        self.mq_manager.connected = True
-
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = "plain text message"
-        mock_result.stderr = ""
-        mock_run.return_value = mock_result
-
-        result = self.mq_manager.get_message("TEST.QUEUE")
-
-        self.assertIsNotNone(result)
-        self.assertEqual(result["data"], "plain text message")
-
-    @patch("subprocess.run")
-    def test_get_message_no_message(self, mock_run):
+    def test_get_message_cases(self):
         """
-        Test message retrieval when no message available.
+        Test message retrieval and payload decoding.
 
-        @brief Test that None is returned when no message is available.
+        @brief Test JSON, plain text and invalid JSON payloads and the amqsget timeout.
         """
         self.mq_manager.connected = True
 
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = ""
-        mock_result.stderr = ""
-        mock_run.return_value = mock_result
+        for name, result, timeout, expected_data in self.GET_CASES:
+            with self.subTest(case=name):
+                self.mock_run.return_value = result
 
-        result = self.mq_manager.get_message("TEST.QUEUE")
+                message = self.mq_manager.get_message("TEST.QUEUE", timeout=timeout)
 
-        self.assertIsNone(result)
+                self.assertEqual(set(message), {"data", "properties", "raw_bytes"})
+                self.assertEqual(message["data"], expected_data)
+                self.assertEqual(
+                    self.mock_run.call_args.kwargs["timeout"], timeout or self.config["timeout"]
+                )
 
-    @patch("subprocess.run")
-    def test_get_message_with_timeout(self, mock_run):
-        """
-        Test message retrieval with custom timeout.
-        """
-        self.mq_manager.connected = True
-
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = "test message"
-        mock_result.stderr = ""
-        mock_run.return_value = mock_result
-
-        result = self.mq_manager.get_message("TEST.QUEUE", timeout=10)
-
-        self.assertIsNotNone(result)
-
-    def test_get_message_not_connected(self):
-        """
-        Test message retrieval when not connected.
-
-        @brief Test that message retrieval fails when not connected to MQ.
-        """
-        with self.assertRaises(Exception) as context:
-            self.mq_manager.get_message("TEST.QUEUE")
-
-        self.assertIn("connection not established", str(context.exception))
-
-    @patch("subprocess.run")
-    def test_get_message_json_decode_error(self, mock_run):
-        """
-        @brief Test get_message with invalid JSON (should fallback to string).
-        """
-        self.mq_manager.connected = True
-
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = "{invalid_json}"
-        mock_result.stderr = ""
-        mock_run.return_value = mock_result
-
-        result = self.mq_manager.get_message("TEST.QUEUE")
-
-        self.assertIsInstance(result["data"], str)
-        self.assertEqual(result["data"], "{invalid_json}")
-
-    @patch("subprocess.run")
-    def test_get_message_with_logger(self, mock_run):
+    def test_get_message_with_logger(self):
         """
         Test get message with logger.
         """
-        mock_logger = MagicMock()
-        mq_manager = MQManager(self.config, mock_logger)
+        logger = self.fake_logger
+        mq_manager = self._manager_with_logger(logger)
         mq_manager.connected = True
 
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = "test message"
-        mock_result.stderr = ""
-        mock_run.return_value = mock_result
+        self.mock_run.return_value = _TEST_MESSAGE
 
         result = mq_manager.get_message("TEST.QUEUE")
 
         self.assertIsNotNone(result)
-        mock_logger.log_mq_operation.assert_called_once()
+        self.assertEqual(logger.log_mq_operation.calls, 1)
 
-    @patch("subprocess.run")
-    def test_get_message_exception(self, mock_run):
+    def test_get_message_exception(self):
         """
         Test get message with exception.
         """
         self.mq_manager.connected = True
 
-        mock_run.side_effect = Exception("Get error")
+        self.mock_run.side_effect = Exception("Get error")
 
         with self.assertRaises(Exception):
             self.mq_manager.get_message("TEST.QUEUE")
 
-    def test_browse_message_not_connected(self):
-        """
-        Test message browsing when not connected.
-
-        @brief Test that message browsing fails when not connected to MQ.
-        """
-        with self.assertRaises(Exception) as context:
-            self.mq_manager.browse_message("TEST.QUEUE")
-
-        self.assertIn("connection not established", str(context.exception))
-
     def test_browse_message_success(self):
         """
         Test successful message browsing.
@@ -710,188 +638,65 @@ class TestMQManager(unittest.TestCase):
         @brief Test that messages are browsed successfully.
         """
         self.mq_manager.connected = True
+        mock_get = self._swap("get_message", Mock(return_value=_BROWSED))
+        mock_put = self._swap("put_message", Mock(return_value=True))
 
-        # Mock get_message to return a message
-        with patch.object(self.mq_manager, "get_message") as mock_get:
-            mock_get.return_value = {
-                "data": "test message",
-                "properties": {"message_id": "msg123"},
-                "raw_bytes": b"test message",
-            }
-
-            # Mock put_message to succeed
-            with patch.object(self.mq_manager, "put_message") as mock_put:
-                mock_put.return_value = True
-
-                result = self.mq_manager.browse_message("TEST.QUEUE")
+        result = self.mq_manager.browse_message("TEST.QUEUE")
 
-                self.assertIsNotNone(result)
-                self.assertEqual(result["data"], "test message")
-                mock_get.assert_called_once()
-                mock_put.assert_called_once()
+        self.assertIsNotNone(result)
+        self.assertEqual(result["data"], "test message")
+        mock_get.assert_called_once()
+        mock_put.assert_called_once()
 
     def test_browse_message_no_message(self):
         """
         Test browsing when no message available.
         """
         self.mq_manager.connected = True
+        self._swap("get_message", Mock(return_value=None))
 
-        with patch.object(self.mq_manager, "get_message") as mock_get:
-            mock_get.return_value = None
-
-            result = self.mq_manager.browse_message("TEST.QUEUE")
+        result = self.mq_manager.browse_message("TEST.QUEUE")
 
-            self.assertIsNone(result)
+        self.assertIsNone(result)
 
     def test_browse_message_with_logger(self):
         """
         Test browse message with logger.
         """
-        mock_logger = MagicMock()
-        mq_manager = MQManager(self.config, mock_logger)
+        logger = self.fake_logger
+        mq_manager = self._manager_with_logger(logger)
         mq_manager.connected = True
+        self._swap("get_message", Mock(return_value=_BROWSED))
+        self._swap("put_message", Mock(return_value=True))
 
-        with patch.object(mq_manager, "get_message") as mock_get:
-            mock_get.return_value = {
-                "data": "test message",
-                "properties": {"message_id": "msg123"},
-                "raw_bytes": b"test message",
-            }
-
-            with patch.object(mq_manager, "put_message") as mock_put:
-                mock_put.return_value = True
+        result = mq_manager.browse_message("TEST.QUEUE")
 
-                result = mq_manager.browse_message("TEST.QUEUE")
-
-                self.assertIsNotNone(result)
-                mock_logger.log_mq_operation.assert_called()
+        self.assertIsNotNone(result)
+        self.assertTrue(logger.log_mq_operation.calls)
 
     def test_browse_message_exception(self):
         """
         Test browse message with exception.
         """
         self.mq_manager.connected = True
+        self._swap("get_message", _raise(Exception("Browse error")))
 
-        with patch.object(self.mq_manager, "get_message") as mock_get:
-            mock_get.side_effect = Exception("Browse error")
-
-            with self.assertRaises(Exception):
-                self.mq_manager.browse_message("TEST.QUEUE")
-
-    @patch("subprocess.run")
-    def test_get_queue_depth_success(self, mock_run):
-        """
-        Test successful queue depth retrieval.
-
-        @brief Test that queue depth is retrieved successfully.
-        """
-        self.mq_manager.connected = True
-
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = "CURDEPTH 5"
-        mock_result.stderr = ""
-        mock_run.return_value = mock_result
-
-        result = self.mq_manager.get_queue_depth("TEST.QUEUE")
-
-        self.assertEqual(result, 5)
-
-    @patch("subprocess.run")
-    def test_get_queue_depth_zero(self, mock_run):
-        """
-        Test queue depth of zero.
-        """
-        self.mq_manager.connected = True
-
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = "CURDEPTH 0"
-        mock_result.stderr = ""
-        mock_run.return_value = mock_result
-
-        result = self.mq_manager.get_queue_depth("TEST.QUEUE")
-
-        self.assertEqual(result, 0)
-
-    @patch("subprocess.run")
-    def test_get_queue_depth_failure(self, mock_run):
-        """
-        Test failed queue depth retrieval.
-
-        @brief Test that queue depth retrieval failures are handled correctly.
-        """
-        self.mq_manager.connected = True
-
-        mock_result = MagicMock()
-        mock_result.returncode = 1
-        mock_result.stdout = ""
-        mock_result.stderr = "Queue not found"
-        mock_run.return_value = mock_result
-
-        result = self.mq_manager.get_queue_depth("TEST.QUEUE")
-
-        self.assertEqual(result, -1)
-
-    def test_get_queue_depth_not_connected(self):
-        """
-        Test queue depth retrieval when not connected.
-
-        @brief Test that queue depth retrieval fails when not connected to MQ.
-        """
-        with self.assertRaises(Exception) as context:
-            self.mq_manager.get_queue_depth("TEST.QUEUE")
-
-        self.assertIn("connection not established", str(context.exception))
-
-    def test_get_queue_depth_parse_error(self):
-        """
-        @brief Test get_queue_depth with unparsable CURDEPTH value.
-        """
-        self.mq_manager.connected = True
-
-        with patch.object(self.mq_manager, "_execute_mq_command") as mock_exec:
-            mock_exec.return_value = {
-                "success": True,
-                "stdout": "CURDEPTH notanumber",
-                "stderr": "",
-                "returncode": 0,
-            }
-
-            result = self.mq_manager.get_queue_depth("TEST.QUEUE")
-            self.assertEqual(result, 0)
-
-    @patch("subprocess.run")
-    def test_get_queue_depth_unexpected_output(self, mock_run):
-        """
-        @brief Test get_queue_depth with unexpected CLI output.
-        """
-        self.mq_manager.connected = True
-
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = "SOMETHING ELSE"
-        mock_result.stderr = ""
-        mock_run.return_value = mock_result
-
-        result = self.mq_manager.get_queue_depth("TEST.QUEUE")
-        self.assertEqual(result, 0)
+        with self.assertRaises(Exception):
+            self.mq_manager.browse_message("TEST.QUEUE")
 
-    @patch("subprocess.run")
-    def test_get_queue_depth_exception(self, mock_run):
+    def test_get_queue_depth_exception(self):
         """
         Test get queue depth with exception.
         """
         self.mq_manager.connected = True
 
-        mock_run.side_effect = Exception("Depth error")
+        self.mock_run.side_effect = Exception("Depth error")
 
         result = self.mq_manager.get_queue_depth("TEST.QUEUE")
 
         self.assertEqual(result, -1)
 
-    @patch("subprocess.run")
-    def test_purge_queue_success(self, mock_run):
+    def test_purge_queue_success(self):
         """
         Test successful queue purging.
 
@@ -903,18 +708,13 @@ class TestMQManager(unittest.TestCase):
         with patch.object(self.mq_manager, "get_queue_depth") as mock_depth:
             mock_depth.return_value = 5
 
-            mock_result = MagicMock()
-            mock_result.returncode = 0
-            mock_result.stdout = "Queue cleared"
-            mock_result.stderr = ""
-            mock_run.return_value = mock_result
+            self.mock_run.return_value = _CLEARED
 
             result = self.mq_manager.purge_queue("TEST.QUEUE")
 
             self.assertEqual(result, 5)
 
-    @patch("subprocess.run")
-    def test_purge_queue_empty(self, mock_run):
+    def test_purge_queue_empty(self):
         """
         Test purging empty queue.
         """
@@ -923,18 +723,13 @@ class TestMQManager(unittest.TestCase):
         with patch.object(self.mq_manager, "get_queue_depth") as mock_depth:
             mock_depth.return_value = 0
 
-            mock_result = MagicMock()
-            mock_result.returncode = 0
-            mock_result.stdout = "Queue cleared"
-            mock_result.stderr = ""
-            mock_run.return_value = mock_result
+            self.mock_run.return_value = _CLEARED
 
             result = self.mq_manager.purge_queue("TEST.QUEUE")
 
             self.assertEqual(result, 0)
 
-    @patch("subprocess.run")
-    def test_purge_queue_failure(self, mock_run):
+    def test_purge_queue_failure(self):
         """
         Test failed queue purging.
 
@@ -942,34 +737,17 @@ class TestMQManager(unittest.TestCase):
         """
         self.mq_manager.connected = True
 
-        mock_result = MagicMock()
-        mock_result.returncode = 1
-        mock_result.stdout = ""
-        mock_result.stderr = "Purge failed"
-        mock_run.return_value = mock_result
-
-        with self.assertRaises(Exception) as context:
-            self.mq_manager.purge_queue("TEST.QUEUE")
-
-        self.assertIn("Failed to purge queue", str(context.exception))
+        self.mock_run.return_value = _PURGE_FAIL
 
-    def test_purge_queue_not_connected(self):
-        """
-        Test queue purging when not connected.
-
-        @brief Test that queue purging fails when not connected to MQ.
-        """
-        with self.assertRaises(Exception) as context:
+        with self.assertRaisesRegex(Exception, "Failed to purge queue"):
             self.mq_manager.purge_queue("TEST.QUEUE")
 
-        self.assertIn("connection not established", str(context.exception))
-
     def test_purge_queue_with_logger(self):
         """
         Test purge queue with logger.
         """
-        mock_logger = MagicMock()
-        mq_manager = MQManager(self.config, mock_logger)
+        logger = self.fake_logger
+        mq_manager = self._manager_with_logger(logger)
         mq_manager.connected = True
 
         with patch.object(mq_manager, "get_queue_depth") as mock_depth:
@@ -986,7 +764,7 @@ class TestMQManager(unittest.TestCase):
                 result = mq_manager.purge_queue("TEST.QUEUE")
 
                 self.assertEqual(result, 5)
-                mock_logger.log_mq_operation.assert_called()
+                self.assertTrue(logger.log_mq_operation.calls)
 
     def test_purge_queue_exception(self):
         """
@@ -1003,40 +781,6 @@ class TestMQManager(unittest.TestCase):
                 with self.assertRaises(Exception):
                     self.mq_manager.purge_queue("TEST.QUEUE")
 
-    @patch("subprocess.run")
-    def test_test_connection_success(self, mock_run):
-        """
-        Test successful connection test.
-
-        @brief Test that connection testing works correctly.
-        """
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = "QMGR display successful"
-        mock_result.stderr = ""
-        mock_run.return_value = mock_result
-
-        result = self.mq_manager.test_connection()
-
-        self.assertTrue(result)
-
-    @patch("subprocess.run")
-    def test_test_connection_failure(self, mock_run):
-        """
-        Test failed connection test.
-
-        @brief Test that connection testing failures are handled correctly.
-        """
-        mock_result = MagicMock()
-        mock_result.returncode = 1
-        mock_result.stdout = ""
-        mock_result.stderr = "Connection failed"
-        mock_run.return_value = mock_result
-
-        result = self.mq_manager.test_connection()
-
-        self.assertFalse(result)
-
     def test_test_connection_exception(self):
         """
         Test connection test with exception.
@@ -1052,8 +796,8 @@ class TestMQManager(unittest.TestCase):
         """
         Test connection test with logger and exception.
         """
-        mock_logger = MagicMock()
-        mq_manager = MQManager(self.config, mock_logger)
+        logger = self.fake_logger
+        mq_manager = self._manager_with_logger(logger)
 
         with patch.object(mq_manager, "_execute_mq_command") as mock_exec:
             mock_exec.side_effect = Exception("Test error")
@@ -1061,4 +805,4 @@ class TestMQManager(unittest.TestCase):
             result = mq_manager.test_connection()
 
             self.assertFalse(result)
-            mock_logger.logger.error.assert_called()
+            self.assertTrue(logger.logger.error.calls)